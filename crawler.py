@@ -45,9 +45,13 @@ def main():
     logger.info(f"Setting up user '{user_id}' from environment variables")
     logger.info(f"Space: {os.getenv('SPACE_NAME') or os.getenv('SPACE_ID')}")
     
+    # Reuse one connection for the health check, user creation and crawl start
+    session = requests.Session()
+    session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    
     # Check if API server is running
     try:
-        response = requests.get(f"{api_url}/system/health", timeout=2)
+        response = session.get(f"{api_url}/system/health", timeout=2)
         if not response.ok:
             logger.error(f"API server at {api_url} is not responding correctly")
             logger.error(f"Please start the server with: uvicorn main:app --host 0.0.0.0 --port {args.port}")
@@ -59,7 +63,7 @@ def main():
     
     # Create user from environment variables
     try:
-        response = requests.post(f"{api_url}/env_user/{user_id}")
+        response = session.post(f"{api_url}/env_user/{user_id}")
         if not response.ok:
             error = response.json().get("detail", "Unknown error")
             logger.error(f"Failed to create user: {error}")
@@ -70,10 +74,10 @@ def main():
         # Run in test mode or start scheduler
         if test_mode:
             logger.info("Running in test mode (one-time crawl)")
-            response = requests.post(f"{api_url}/test/{user_id}")
+            response = session.post(f"{api_url}/test/{user_id}")
         else:
             logger.info("Starting scheduled crawling")
-            response = requests.post(f"{api_url}/start/{user_id}")
+            response = session.post(f"{api_url}/start/{user_id}")
             
         if not response.ok:
             error = response.json().get("detail", "Unknown error")
@@ -95,6 +99,8 @@ def main():
     except Exception as e:
         logger.error(f"Error: {str(e)}")
         return 1
+    finally:
+        session.close()
 
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file
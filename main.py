@@ -11,29 +11,46 @@ import os
 import logging
 import time
 import sys
-import json
 import requests
+import orjson
+import ijson
 import threading
-from typing import List, Dict, Set, Optional, Any
-from dataclasses import dataclass
+import concurrent.futures
+import functools
+import heapq
+import pathlib
+import math
+import random
+from collections import defaultdict, deque
+from typing import List, Dict, DefaultDict, Set, FrozenSet, Optional, Any, Tuple
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import argparse
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+import anyio.to_thread
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict, Field
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.jobstores.base import JobLookupError
 from dotenv import load_dotenv
-
-# ANSI color codes for console output
-RED = "\033[91m"
-GREEN = "\033[92m"
-YELLOW = "\033[93m"
-BLUE = "\033[94m"
-MAGENTA = "\033[95m"
-CYAN = "\033[96m"
-BOLD = "\033[1m"
-RESET = "\033[0m"
+import urllib3.exceptions
+from urllib3.util.retry import Retry
+
+# ANSI color codes for console output, only when logging to a terminal
+# (docker logs, files and aggregators get plain text without escape bytes)
+_IS_TTY = sys.stderr.isatty()
+RED = "\033[91m" if _IS_TTY else ""
+GREEN = "\033[92m" if _IS_TTY else ""
+YELLOW = "\033[93m" if _IS_TTY else ""
+BLUE = "\033[94m" if _IS_TTY else ""
+MAGENTA = "\033[95m" if _IS_TTY else ""
+CYAN = "\033[96m" if _IS_TTY else ""
+BOLD = "\033[1m" if _IS_TTY else ""
+RESET = "\033[0m" if _IS_TTY else ""
 
 # Parse command line arguments for log mode
 parser = argparse.ArgumentParser(description="Crawler API Server")
@@ -55,11 +72,16 @@ console_handler = logging.StreamHandler()
 console_handler.setLevel(log_level)
 console_handler.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
 
+class SummaryFilter(logging.Filter):
+    """Pass only records logged with extra={"summary": True}, without formatting the message."""
+    def filter(self, record: logging.LogRecord) -> bool:
+        return getattr(record, "summary", False)
+
 # Special handler just for summary logs in production mode
 if LOG_MODE == "production":
     summary_handler = logging.StreamHandler()
     summary_handler.setLevel(logging.INFO)
-    summary_handler.addFilter(lambda record: "CRAWLER STATUS SUMMARY" in record.getMessage() or "Startup" in record.getMessage())
+    summary_handler.addFilter(SummaryFilter())
     summary_handler.setFormatter(logging.Formatter("%(message)s"))
     handlers = [console_handler, summary_handler]
 else:
@@ -72,22 +94,77 @@ logging.basicConfig(
 )
 
 logger = logging.getLogger(__name__)
-logger.info(f"{BOLD}{GREEN}Starting crawler in {LOG_MODE.upper()} mode{RESET}")
+logger.info("%s%sStarting crawler in %s mode%s", BOLD, GREEN, LOG_MODE.upper(), RESET)
+
+# ------------------- Helpers -------------------
+@functools.lru_cache(maxsize=4096)
+def _normalize_url(url: Optional[str]) -> str:
+    """Normalize a URL or site identifier for filter matching (cached, filters repeat every tick)."""
+    if not url:
+        return ""
+    # Strip whitespace and trailing slashes, then convert to lowercase
+    normalized = url.strip().rstrip('/').lower()
+    
+    # Handle fragment identifiers
+    if '#' in normalized:
+        normalized = normalized.split('#')[0]
+    
+    # Handle query parameters
+    if '?' in normalized:
+        normalized = normalized.split('?')[0]
+        
+    return normalized
+
+def _loads(response: requests.Response) -> Any:
+    """Parse a JSON response body with orjson (faster than response.json())."""
+    return orjson.loads(response.content)
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_ago(secs: int) -> str:
+    """Format elapsed seconds as "42s ago", "5m ago" or "2h 5m ago"."""
+    hours, rem = divmod(secs, 3600)
+    minutes, seconds = divmod(rem, 60)
+    if hours:
+        return f"{hours}h {minutes}m ago"
+    return f"{minutes}m ago" if minutes else f"{seconds}s ago"
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_duration(secs: int) -> str:
+    """Format a run duration as "12m 5s"."""
+    minutes, seconds = divmod(secs, 60)
+    return f"{minutes}m {seconds}s"
+
+def _identifiers(site: Dict) -> Set[str]:
+    """Normalized, non-empty id/name/url of a website, for filter matching."""
+    identifiers = set()
+    for key in ("id", "name", "url"):
+        value = site.get(key)
+        if value:
+            normalized = _normalize_url(str(value))
+            if normalized:
+                identifiers.add(normalized)
+    return identifiers
 
 # ------------------- Data Classes -------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AppConfig:
     """Application configuration container."""
     api_key: str
     base_url: str
     schedule_minutes: int
-    website_filter: Set[str]
+    website_filter: FrozenSet[str]
     status_check_interval: int = 60  # Seconds between status checks
     space_id: Optional[str] = None
     space_name: Optional[str] = None
     crawl_all_space_websites: bool = False
+    # website_filter normalized once for matching (derived, not passed in)
+    normalized_filters: FrozenSet[str] = field(init=False, repr=False, compare=False)
 
-@dataclass
+    def __post_init__(self):
+        normalized = frozenset(_normalize_url(f) for f in self.website_filter) - {""}
+        object.__setattr__(self, "normalized_filters", normalized)
+
+@dataclass(slots=True)
 class JobStatus:
     """Track the status of crawl jobs."""
     site_id: str
@@ -99,9 +176,14 @@ class JobStatus:
     error_message: Optional[str] = None
     last_update: Optional[datetime] = None
     last_successful_crawl: Optional[datetime] = None
+    # True when this scheduler triggered the run, so start_time is its real start
+    triggered: bool = False
 
 class ConfigModel(BaseModel):
     """Model for setting/updating config via API."""
+    # Reject unknown keys, skip type coercion ("5" is not an int) and keep the payload immutable
+    model_config = ConfigDict(extra="forbid", frozen=True, strict=True)
+
     api_key: str = Field(..., description="Must start with 'inp_'")
     base_url: str = Field(..., description="Remote crawler API base URL")
     schedule_minutes: int = Field(5, description="How often to run the crawl in minutes")
@@ -111,38 +193,108 @@ class ConfigModel(BaseModel):
     space_name: Optional[str] = Field(None, description="Name of the space to use (alternative to space_id)")
     crawl_all_space_websites: bool = Field(False, description="Whether to crawl all websites in the space")
 
+class ProvisionModel(ConfigModel):
+    """Config plus the follow-up steps for /provision (config, start and test in one call)."""
+    start: bool = Field(True, description="Start scheduling crawls after setting the config")
+    test: bool = Field(True, description="Trigger an immediate one-time crawl of all sites")
+
+# Maximum number of sites crawled concurrently in a one-time test run
+MAX_CONCURRENT_SITES = int(os.getenv("MAX_CONCURRENT_SITES", "10"))
+
+# Shared pool for fanning out independent API requests (e.g. run lists of several websites)
+API_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SITES, thread_name_prefix="api")
+
+# Threads the crawl monitor polls users on, so one slow or rate-limited API host can't hold up the rest
+MONITOR_WORKERS = int(os.getenv("MONITOR_WORKERS", "8"))
+
+# Worker threads for the sync (blocking) API endpoints; anyio's default is 40
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "100"))
+
+# Limits on crawl triggers so a busy tick doesn't burst the API into 429s
+MAX_CONCURRENT_TRIGGERS = int(os.getenv("MAX_CONCURRENT_TRIGGERS", "20"))
+TRIGGER_RATE_PER_SECOND = int(os.getenv("TRIGGER_RATE_PER_SECOND", "5"))
+_TRIGGER_SEM = threading.BoundedSemaphore(MAX_CONCURRENT_TRIGGERS)
+
+# Crawl states that count as in-flight / as failed (O(1) membership checks)
+_ACTIVE_STATUSES = frozenset(("running", "queued"))
+_FAILED_STATUSES = frozenset(("failed", "cancelled"))
+
 # ------------------- Global State -------------------
 # Stores configuration and status for each user
 USER_CONFIGS: Dict[str, AppConfig] = {}
 USER_API_CLIENTS: Dict[str, Any] = {}
 USER_WEBSITES: Dict[str, List[Dict]] = {}
 USER_JOBS_CREATED: Dict[str, bool] = {}
-USER_JOB_STATUS: Dict[str, Dict[str, JobStatus]] = {}
+USER_JOB_STATUS: DefaultDict[str, Dict[str, JobStatus]] = defaultdict(dict)
+# Scheduler job ids per user, maintained by add_user_job/clear_jobs
+USER_JOB_IDS: Dict[str, Set[str]] = {}
+# Ids of the scheduler's own (non-user) jobs, e.g. the status summary and website refresh
+SYSTEM_JOB_IDS: Set[str] = set()
+# Per-user scheduler executors, so one user's slow API can't occupy every worker
+USER_EXECUTORS: Dict[str, ThreadPoolExecutor] = {}
+USER_EXECUTOR_WORKERS = int(os.getenv("USER_EXECUTOR_WORKERS", "4"))
+# Held while a crawl for (user_id, site_id) is being started, to drop overlapping triggers
+JOB_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
+# Durations (seconds) of the last completed crawls per website id, used to place status polls
+SITE_DURATION_HIST: Dict[str, deque] = {}
+SITE_DURATION_SAMPLES = 50
+SITE_DURATION_MIN_SAMPLES = 5
+# base user id -> its configured user ids ("user", "user_space1", ...), kept in insertion order
+USER_GROUPS: Dict[str, List[str]] = {}
+
+# One lock per user guards the structure of USER_JOB_STATUS[user_id]
+USER_LOCKS: Dict[str, threading.RLock] = {}
+_USER_LOCKS_GUARD = threading.Lock()
+
+def _user_lock(user_id: str) -> threading.RLock:
+    """Return the lock guarding this user's job status dict."""
+    with _USER_LOCKS_GUARD:
+        return USER_LOCKS.setdefault(user_id, threading.RLock())
+
+def snapshot_user_jobs(user_id: str) -> List[JobStatus]:
+    """Copy a user's job statuses so callers can iterate without holding the lock."""
+    with _user_lock(user_id):
+        return list(USER_JOB_STATUS.get(user_id, {}).values())
 
 # ------------------- Status Summary Generation -------------------
-def generate_user_status_summary():
+@dataclass
+class _SummaryState:
+    """Rate-limit state for the status summary (shared by scheduler and API threads)."""
+    last_time: datetime = datetime.min
+    # Set whenever a job status changes; an unchanged state reuses last_data
+    dirty: bool = True
+    last_data: Dict[str, Any] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+_SUMMARY = _SummaryState()
+# How long /system/status-summary may return the previous summary when nothing changed
+SUMMARY_CACHE_SECONDS = 10
+
+def generate_user_status_summary(called_from_endpoint: bool = False):
     """Generate a concise summary of all users' crawl job statuses for logs"""
-    if LOG_MODE != "production":
+    if LOG_MODE != "production" or not logger.isEnabledFor(logging.INFO):
         return {}  # Return empty dict instead of None
     
-    # Add a timestamp to limit how often we generate summaries
-    last_summary_time = getattr(generate_user_status_summary, "last_summary_time", datetime.min)
     current_time = datetime.now()
     
     # Don't generate more than one summary per minute (except for explicit calls)
-    was_called_from_endpoint = getattr(generate_user_status_summary, "called_from_endpoint", False)
-    time_since_last = (current_time - last_summary_time).total_seconds()
-    
-    if not was_called_from_endpoint and time_since_last < 60:
-        return {}
-        
-    # Reset the flag
-    generate_user_status_summary.called_from_endpoint = False
-    generate_user_status_summary.last_summary_time = current_time
+    with _SUMMARY.lock:
+        time_since_last = (current_time - _SUMMARY.last_time).total_seconds()
+        if not called_from_endpoint and time_since_last < 60:
+            return {}
+        # Nothing changed since the last summary: skip the pass. Explicit calls only reuse it
+        # for a few seconds, since its "ago" times go stale; config and job changes set dirty
+        if not _SUMMARY.dirty and (not called_from_endpoint or time_since_last < SUMMARY_CACHE_SECONDS):
+            return _SUMMARY.last_data
+        # Reset the flag
+        _SUMMARY.dirty = False
+        _SUMMARY.last_time = current_time
     
     if not USER_CONFIGS:
-        logger.info(f"{BOLD}{YELLOW}No users configured yet{RESET}")
-        return {"status": "no_users", "message": "No users configured yet"}
+        logger.info("%s%sNo users configured yet%s", BOLD, YELLOW, RESET)
+        # Remember this result too, so an unchanged state doesn't return an older summary
+        _SUMMARY.last_data = {"status": "no_users", "message": "No users configured yet"}
+        return _SUMMARY.last_data
         
     summary_lines = [f"\n{BOLD}{CYAN}===== CRAWLER STATUS SUMMARY ====={RESET}"]
     summary_lines.append(f"{BOLD}{CYAN}Time: {current_time.strftime('%Y-%m-%d %H:%M:%S')}{RESET}")
@@ -153,27 +305,15 @@ def generate_user_status_summary():
         "users": {}
     }
     
-    # Group users by base user_id (before _space suffix)
-    user_groups = {}
-    for user_id, config in USER_CONFIGS.items():
-        # Handle "user_spaceN" format by extracting base user id
-        if "_space" in user_id:
-            base_user_id = user_id.split("_space")[0]
-        else:
-            base_user_id = user_id
-            
-        if base_user_id not in user_groups:
-            user_groups[base_user_id] = []
-        user_groups[base_user_id].append((user_id, config))
-    
     # Process each base user
-    for base_user_id, user_configs in sorted(user_groups.items()):
-        for user_id, config in user_configs:
+    for base_user_id, user_ids in sorted(USER_GROUPS.items()):
+        for user_id in user_ids:
+            config = USER_CONFIGS[user_id]
             # Get space info
             space_name = config.space_name or config.space_id or "Unknown Space"
             
             # Only show space name for users with multiple spaces
-            if len(user_configs) > 1:
+            if len(user_ids) > 1:
                 user_display = f"{base_user_id} - Space: {space_name}"
             else:
                 user_display = base_user_id
@@ -184,7 +324,7 @@ def generate_user_status_summary():
             
             user_data = {
                 "space_name": space_name,
-                "space_id": config.space_id,
+                "space_id": getattr(USER_API_CLIENTS.get(user_id), "space_id", None) or config.space_id,
                 "website_count": 0,
                 "running_count": 0,
                 "completed_count": 0,
@@ -194,30 +334,42 @@ def generate_user_status_summary():
                 "running_sites": []
             }
             
-            if user_id not in USER_JOB_STATUS or not USER_JOB_STATUS[user_id]:
+            jobs = snapshot_user_jobs(user_id)
+            if not jobs:
                 summary_lines.append(f"{BOLD}{YELLOW}User: {user_display} - No jobs running{RESET}")
                 user_data["status"] = "no_jobs"
                 summary_data["users"][base_user_id][space_name] = user_data
                 continue
                 
-            # Count jobs by status
-            running_count = 0
-            failed_count = 0
-            completed_count = 0
-            website_count = len(USER_JOB_STATUS[user_id])
+            website_count = len(jobs)
             user_data["website_count"] = website_count
             
-            # Check for actively running jobs (within last 2 minutes)
-            active_threshold = current_time - timedelta(minutes=2)
+            # Check for actively running jobs (checked within the longest status backoff interval)
+            active_threshold = current_time - timedelta(seconds=max(120, config.status_check_interval * 10 + 60))
             
-            for site_id, status in USER_JOB_STATUS[user_id].items():
+            # Single pass: count by status, find the latest success, collect failed/running sites
+            completed_count = 0
+            latest_crawl = None
+            failed_count = 0
+            unique_failures = {}
+            running_jobs = []
+            for status in jobs:
+                st = status.status
+                lu = status.last_update
+                lsc = status.last_successful_crawl
+                if lsc and (not latest_crawl or lsc > latest_crawl):
+                    latest_crawl = lsc
                 # Consider both "running" and "queued" as active jobs
-                if (status.status in ("running", "queued")) and status.last_update and status.last_update > active_threshold:
-                    running_count += 1
-                elif status.status in ("failed", "cancelled"):
+                if st in _ACTIVE_STATUSES:
+                    if lu and lu > active_threshold:
+                        running_jobs.append(status)
+                elif st in _FAILED_STATUSES:
                     failed_count += 1
-                elif status.status == "complete":
+                    # Keep the first error seen per site name
+                    unique_failures.setdefault(status.site_name, status.error_message or "Unknown error")
+                elif st == "complete":
                     completed_count += 1
+            running_count = len(running_jobs)
             
             user_data["running_count"] = running_count
             user_data["completed_count"] = completed_count
@@ -238,43 +390,17 @@ def generate_user_status_summary():
             summary_lines.append(f"  Websites: {website_count} | Running: {running_count} | Completed: {completed_count} | Failed: {failed_count}")
             
             # Add last successful crawl info
-            latest_crawl = None
-            for site_id, status in USER_JOB_STATUS[user_id].items():
-                if status.last_successful_crawl:
-                    if not latest_crawl or status.last_successful_crawl > latest_crawl:
-                        latest_crawl = status.last_successful_crawl
-            
             if latest_crawl:
                 time_since = (current_time - latest_crawl).total_seconds()
                 user_data["latest_crawl"] = latest_crawl.isoformat()
                 user_data["latest_crawl_seconds_ago"] = int(time_since)
                 
-                if time_since < 60:
-                    time_display = f"{int(time_since)}s ago"
-                elif time_since < 3600:
-                    time_display = f"{int(time_since // 60)}m ago"
-                else:
-                    time_display = f"{int(time_since // 3600)}h {int((time_since % 3600) // 60)}m ago"
-                summary_lines.append(f"  Last successful crawl: {time_display}")
+                summary_lines.append(f"  Last successful crawl: {_fmt_ago(max(0, int(time_since)))}")
             
             # Show details of any failed jobs
             if failed_count > 0:
                 summary_lines.append(f"  {BOLD}{RED}Failed Jobs:{RESET}")
-                failed_sites = []
-                for site_id, status in USER_JOB_STATUS[user_id].items():
-                    if status.status in ("failed", "cancelled"):
-                        error = status.error_message or "Unknown error"
-                        failed_sites.append((status.site_name, error))
-                
-                # Remove duplicate errors
-                seen = set()
-                unique_failures = []
-                for site_name, error in failed_sites:
-                    if site_name not in seen:
-                        seen.add(site_name)
-                        unique_failures.append((site_name, error))
-                        
-                for site_name, error in unique_failures:
+                for site_name, error in unique_failures.items():
                     summary_lines.append(f"    - {site_name}: {error}")
                     user_data["failed_sites"].append({
                         "site_name": site_name,
@@ -284,25 +410,23 @@ def generate_user_status_summary():
             # Show currently running jobs
             if running_count > 0:
                 summary_lines.append(f"  {BOLD}{GREEN}Running Jobs:{RESET}")
-                for site_id, status in USER_JOB_STATUS[user_id].items():
-                    if (status.status in ("running", "queued")) and status.last_update and status.last_update > active_threshold:
-                        duration = "Unknown"
-                        duration_seconds = None
-                        if status.start_time:
-                            duration_secs = (current_time - status.start_time).total_seconds()
-                            duration_seconds = int(duration_secs)
-                            duration = f"{int(duration_secs // 60)}m {int(duration_secs % 60)}s"
-                        # Show status (queued or running)
-                        status_display = f"({status.status} for {duration})"
-                        summary_lines.append(f"    - {status.site_name} {status_display}")
-                        
-                        user_data["running_sites"].append({
-                            "site_name": status.site_name, 
-                            "status": status.status,
-                            "duration_seconds": duration_seconds,
-                            "duration_display": duration,
-                            "run_id": status.run_id
-                        })
+                for status in running_jobs:
+                    duration = "Unknown"
+                    duration_seconds = None
+                    if status.start_time:
+                        duration_seconds = int((current_time - status.start_time).total_seconds())
+                        duration = _fmt_duration(duration_seconds)
+                    # Show status (queued or running)
+                    status_display = f"({status.status} for {duration})"
+                    summary_lines.append(f"    - {status.site_name} {status_display}")
+                    
+                    user_data["running_sites"].append({
+                        "site_name": status.site_name, 
+                        "status": status.status,
+                        "duration_seconds": duration_seconds,
+                        "duration_display": duration,
+                        "run_id": status.run_id
+                    })
             
             # Add this user's data to the structured summary
             summary_data["users"][base_user_id][space_name] = user_data
@@ -311,16 +435,41 @@ def generate_user_status_summary():
     
     # Log this with special formatting that will always appear in console
     summary_message = "\n".join(summary_lines)
-    logger.info(summary_message)
+    logger.info(summary_message, extra={"summary": True})
     
     # Return the structured summary data for API response
+    _SUMMARY.last_data = summary_data
     return summary_data
 
+# Summaries requested from job threads are built here, off the crawl path
+SUMMARY_REQUESTED = threading.Event()
+_SUMMARY_STOP = threading.Event()
+
+def request_status_summary():
+    """Ask the summary thread for a new summary; requests within a second collapse into one."""
+    SUMMARY_REQUESTED.set()
+
+def _summary_worker():
+    while True:
+        SUMMARY_REQUESTED.wait()
+        if _SUMMARY_STOP.is_set():
+            return
+        time.sleep(1.0)
+        SUMMARY_REQUESTED.clear()
+        try:
+            generate_user_status_summary()
+        except Exception as e:
+            logger.error("%sError generating status summary: %s%s", RED, e, RESET)
+
+def stop_summary_worker():
+    _SUMMARY_STOP.set()
+    SUMMARY_REQUESTED.set()
+
 # Add the function to APScheduler for periodic status updates
 def setup_status_logger(scheduler):
     """Set up periodic status logging for production mode"""
     if LOG_MODE == "production":
-        logger.info(f"{GREEN}Setting up periodic status logger (every 5 minutes){RESET}")
+        logger.info("%sSetting up periodic status logger (every 5 minutes)%s", GREEN, RESET)
         scheduler.add_job(
             generate_user_status_summary,
             "interval",
@@ -328,36 +477,113 @@ def setup_status_logger(scheduler):
             id="status_summary_logger",
             replace_existing=True
         )
+        SYSTEM_JOB_IDS.add("status_summary_logger")
         generate_user_status_summary()  # Run immediately
 
 # ------------------- Crawler Client -------------------
+class RateLimiter:
+    """Sliding-window limiter allowing at most `rate` calls per second (0 disables it)."""
+    def __init__(self, rate: int):
+        self.rate = rate
+        self._calls: deque = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= 1.0:
+                    self._calls.popleft()
+                if len(self._calls) < self.rate:
+                    self._calls.append(now)
+                    return
+                wait = 1.0 - (now - self._calls[0])
+            time.sleep(wait)
+
+# One keep-alive connection pool per API base_url, shared by all user configurations
+_SESSIONS: Dict[str, requests.Session] = {}
+# Crawl trigger rate limiter per API base_url
+_TRIGGER_LIMITERS: Dict[str, RateLimiter] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+def _build_session() -> requests.Session:
+    """Create a pooled session for one API host."""
+    session = requests.Session()
+    session.headers.update({"Connection": "keep-alive"})
+    # Retry rate-limited and gateway errors with exponential backoff. Only GETs are retried:
+    # a 429 on the run endpoint means "already queued" (intric_error_code 9021) and must reach
+    # _handle_api_error untouched, and retrying POSTs could trigger duplicate crawls.
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    # Sized for concurrent site jobs across all users on this host
+    adapter = requests.adapters.HTTPAdapter(
+        max_retries=retry,
+        pool_connections=32,
+        pool_maxsize=max(64, MAX_CONCURRENT_SITES * 2),
+        pool_block=False
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
 class CrawlerAPIClient:
     """Handles API communication with enhanced error handling"""
+    # Seconds a website's {run_id: status} index is reused before /runs/ is fetched again
+    RUNS_CACHE_TTL = 5
+    # Seconds the name -> space index from /spaces/ is reused
+    SPACES_CACHE_TTL = 300
+    # Websites whose ETag is kept for conditional status requests (oldest dropped first)
+    WEBSITE_ETAGS_MAX = 1024
+
     def __init__(self, config: AppConfig):
         self.config = config
-        self.session = requests.Session()
+        # Resolved lazily from space_name when only a name is configured
+        self.space_id: Optional[str] = config.space_id
+        with _SESSIONS_LOCK:
+            if self.config.base_url not in _SESSIONS:
+                _SESSIONS[self.config.base_url] = _build_session()
+            self.session = _SESSIONS[self.config.base_url]
+            self.trigger_limiter = _TRIGGER_LIMITERS.setdefault(self.config.base_url, RateLimiter(TRIGGER_RATE_PER_SECOND))
+        # (fetched_at, cache_key, websites) for the last get_websites() result
+        self._websites_cache: Optional[Tuple[float, Tuple, List[Dict]]] = None
+        # ETag of the knowledge response behind _websites_cache, for conditional requests
+        self._websites_etag: Optional[str] = None
+        # latest_crawl per website id from the last listing, and when it was fetched
+        self._latest_crawls: Dict[str, Dict] = {}
+        self._latest_crawls_at: float = 0.0
+        # (fetched_at, {run_id: status}) per website id from the last /runs/ response
+        self._runs_cache: Dict[str, Tuple[float, Dict[str, str]]] = {}
+        # (ETag, {"id", "latest_crawl"}) of the last /websites/{id}/ response per website id
+        self._website_etags: Dict[str, Tuple[str, Dict]] = {}
+        # (fetched_at, {name: space}, {folded name: space}) from the last /spaces/ response
+        self._spaces_cache: Optional[Tuple[float, Dict[str, Dict], Dict[str, Dict]]] = None
 
         # Partial mask for logging
         masked = self.config.api_key[:10] + "..." if len(self.config.api_key) > 10 else self.config.api_key
-        logger.info(f"{BLUE}Using API key='api-key': {masked}{RESET}")
+        logger.info("%sUsing API key='api-key': %s%s", BLUE, masked, RESET)
 
-        self.session.headers.update({
+        # Auth is sent per request because the session is shared by every client on this base_url
+        self.headers = {
             "api-key": self.config.api_key,
             "accept": "application/json"
-        })
-        self.session.mount('https://', requests.adapters.HTTPAdapter(
-            max_retries=3,
-            pool_maxsize=10
-        ))
+        }
 
     def _handle_api_error(self, response: requests.Response):
         try:
-            error_data = response.json()
+            error_data = _loads(response)
             intric_error_code = error_data.get("intric_error_code")
             
             # Handle "already queued" or rate limiting error
             if response.status_code == 429 and intric_error_code == 9021:
-                logger.warning(f"{YELLOW}Website already has a crawl in queue/progress (code 9021){RESET}")
+                logger.warning("%sWebsite already has a crawl in queue/progress (code 9021)%s", YELLOW, RESET)
                 # Don't raise an exception - return a special response instead
                 return {"status": "queued", "intric_error_code": 9021, "already_queued": True}
                 
@@ -365,215 +591,335 @@ class CrawlerAPIClient:
             error_data = {"detail": "Unknown error - non-JSON response"}
 
         error_msg = f"API Error {response.status_code}: {error_data.get('detail', 'Unknown error')}"
-        logger.error(f"{RED}{error_msg}{RESET}")
+        logger.error("%s%s%s", RED, error_msg, RESET)
         
         if LOG_MODE == "debug":
-            logger.debug(f"Error response headers: {response.headers}")
-            logger.debug(f"Error response content: {response.text[:1000]}")
+            logger.debug("Error response headers: %s", response.headers)
+            logger.debug("Error response content: %s", response.text[:1000])
         
         response.raise_for_status()
 
-    def _normalize_url(self, url: Optional[str]) -> str:
-        if not url:
-            return ""
-        # Convert to lowercase, strip whitespace, remove trailing slashes
-        normalized = url.lower().strip().rstrip('/')
-        
-        # Handle fragment identifiers
-        if '#' in normalized:
-            normalized = normalized.split('#')[0]
-        
-        # Handle query parameters
-        if '?' in normalized:
-            normalized = normalized.split('?')[0]
-            
-        return normalized
+    def poll_interval_seq(self, max_interval: Optional[int] = None):
+        """
+        Yield seconds to wait between status checks, doubling from the configured
+        status_check_interval up to max_interval (default 10x the base interval).
+        """
+        interval = max(1, self.config.status_check_interval)
+        max_interval = max_interval or interval * 10
+        while True:
+            yield interval
+            interval = min(interval * 2, max_interval)
 
     def get_spaces(self) -> List[Dict]:
         """Fetch all spaces the user can access."""
         try:
-            logger.info(f"{CYAN}Fetching all spaces from {self.config.base_url}/spaces/{RESET}")
-            response = self.session.get(f"{self.config.base_url}/spaces/", timeout=10)
+            logger.info("%sFetching all spaces from %s/spaces/%s", CYAN, self.config.base_url, RESET)
+            response = self.session.get(f"{self.config.base_url}/spaces/", headers=self.headers, timeout=10)
             if not response.ok:
                 self._handle_api_error(response)
-            data = response.json()
+            data = _loads(response)
             spaces = data.get("items", [])
-            logger.info(f"{CYAN}Found {len(spaces)} space(s).{RESET}")
+            logger.info("%sFound %s space(s).%s", CYAN, len(spaces), RESET)
             return spaces
 
         except requests.RequestException as e:
-            logger.error(f"{RED}Network error when fetching spaces: {str(e)}{RESET}")
+            logger.error("%sNetwork error when fetching spaces: %s%s", RED, e, RESET)
             raise
         except Exception as e:
-            logger.error(f"{RED}Unexpected error when fetching spaces: {str(e)}{RESET}")
+            logger.error("%sUnexpected error when fetching spaces: %s%s", RED, e, RESET)
             raise
 
     def get_space_by_id(self, space_id: str) -> Dict:
         """Get a specific space by its ID."""
         try:
-            logger.info(f"{CYAN}Fetching space by ID: {space_id}{RESET}")
-            response = self.session.get(f"{self.config.base_url}/spaces/{space_id}/", timeout=10)
+            logger.info("%sFetching space by ID: %s%s", CYAN, space_id, RESET)
+            response = self.session.get(f"{self.config.base_url}/spaces/{space_id}/", headers=self.headers, timeout=10)
             if not response.ok:
                 self._handle_api_error(response)
-            return response.json()
+            return _loads(response)
         except requests.RequestException as e:
-            logger.error(f"{RED}Network error fetching space {space_id}: {str(e)}{RESET}")
+            logger.error("%sNetwork error fetching space %s: %s%s", RED, space_id, e, RESET)
             raise
 
     def find_space_by_name(self, space_name: str) -> Optional[Dict]:
-        """Find a space by name from the list of spaces."""
-        all_spaces = self.get_spaces()
+        """Find a space by name from the (cached) list of spaces."""
         space_name_lower = space_name.strip().lower()
 
-        logger.info(f"{CYAN}Looking for space named '{space_name}'{RESET}")
+        logger.info("%sLooking for space named '%s'%s", CYAN, space_name, RESET)
+
+        cached = self._spaces_cache
+        if not cached or time.monotonic() - cached[0] >= self.SPACES_CACHE_TTL:
+            # Index the spaces by exact and by underscore/hyphen-folded name in one pass
+            exact, folded = {}, {}
+            for sp in self.get_spaces():
+                sp_name = sp.get("name", "").strip().lower()
+                exact.setdefault(sp_name, sp)
+                folded.setdefault(sp_name.replace("_", "-"), sp)
+            cached = self._spaces_cache = (time.monotonic(), exact, folded)
+        _, exact, folded = cached
 
         # First try exact match
-        for sp in all_spaces:
-            sp_name = sp.get("name", "").strip().lower()
-            if sp_name == space_name_lower:
-                logger.info(f"{GREEN}Found exact match for space '{space_name}': {sp.get('name')}{RESET}")
-                return sp
+        sp = exact.get(space_name_lower)
+        if sp:
+            logger.info("%sFound exact match for space '%s': %s%s", GREEN, space_name, sp.get('name'), RESET)
+            return sp
 
         # Then try fuzzy match - handle underscore/hyphen differences
-        for sp in all_spaces:
-            sp_name = sp.get("name", "").strip().lower()
-            if sp_name.replace("_", "-") == space_name_lower.replace("_", "-"):
-                logger.info(f"{GREEN}Found fuzzy match for space '{space_name}': {sp.get('name')}{RESET}")
-                return sp
+        sp = folded.get(space_name_lower.replace("_", "-"))
+        if sp:
+            logger.info("%sFound fuzzy match for space '%s': %s%s", GREEN, space_name, sp.get('name'), RESET)
+            return sp
 
-        logger.warning(f"{YELLOW}No space found with name '{space_name}'{RESET}")
+        logger.warning("%sNo space found with name '%s'%s", YELLOW, space_name, RESET)
         return None
 
     def get_website_status(self, website_id: str) -> Optional[Dict]:
         """
         Get the current status of a website and its latest crawl directly.
         This is used to check if a website already has a queued or running crawl.
+        Returns None if the check failed.
         """
         try:
-            logger.debug(f"Checking website status for website_id={website_id}")
-            response = self.session.get(
-                f"{self.config.base_url}/websites/{website_id}/",
-                timeout=10
-            )
-            if not response.ok:
-                self._handle_api_error(response)
-                
-            website_data = response.json()
-            latest_crawl = website_data.get("latest_crawl", {})
-            
-            # Extract the status and other details from the latest crawl
-            status = latest_crawl.get("status")
-            run_id = latest_crawl.get("id")
-            
-            if status and status in ("queued", "running"):
-                logger.info(f"{YELLOW}Website {website_id} already has a {status} crawl (Run ID: {run_id}){RESET}")
-                return {
-                    "status": status,
-                    "run_id": run_id,
-                    "latest_crawl": latest_crawl,
-                    "already_active": True
-                }
-            
-            return website_data
-            
+            return self._website_status(website_id, self._fetch_website(website_id))
         except requests.RequestException as e:
-            logger.error(f"{RED}Error checking website status: {str(e)}{RESET}")
+            logger.error("%sError checking website status: %s%s", RED, e, RESET)
             return None
         except Exception as e:
-            logger.error(f"{RED}Unexpected error when checking website status: {str(e)}{RESET}")
+            logger.error("%sUnexpected error when checking website status: %s%s", RED, e, RESET)
+            return None
+
+    def _fetch_website(self, website_id: str) -> Dict:
+        """Fetch a website's data (revalidated with its ETag); raises if the request fails."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Checking website status for website_id=%s", website_id)
+        # Revalidate the last response for this website so an unchanged one skips the body
+        headers = self.headers
+        cached = self._website_etags.get(website_id)
+        if cached:
+            headers = {**self.headers, "If-None-Match": cached[0]}
+        response = self.session.get(
+            f"{self.config.base_url}/websites/{website_id}/",
+            headers=headers,
+            timeout=10
+        )
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if not response.ok:
+            self._handle_api_error(response)
+        
+        website_data = _loads(response)
+        etag = response.headers.get("ETag")
+        self._website_etags.pop(website_id, None)
+        if etag:
+            # Keep only what status checks read, and only for the most recently checked websites
+            if len(self._website_etags) >= self.WEBSITE_ETAGS_MAX:
+                self._website_etags.pop(next(iter(self._website_etags)))
+            self._website_etags[website_id] = (etag, {"id": website_data.get("id"), "latest_crawl": website_data.get("latest_crawl")})
+        return website_data
+
+    def get_latest_run_status(self, website_id: str) -> Optional[Dict]:
+        """
+        Return {"id", "status"} of the website's latest crawl run, or None if it has none.
+        Request errors are raised, so callers can tell a failed check from "no run".
+        """
+        latest_crawl = self._fetch_website(website_id).get("latest_crawl")
+        if not latest_crawl:
             return None
+        return {"id": latest_crawl.get("id"), "status": latest_crawl.get("status")}
 
-    def get_websites_for_space(self) -> List[Dict]:
-        """Get websites from space data via the knowledge endpoint."""
+    def get_cached_status(self, website_id: str, max_age: Optional[float] = None) -> Optional[Dict]:
+        """
+        Same as get_website_status, but answered from the latest_crawl data of the last
+        website listing if it is at most max_age seconds old (default status_check_interval).
+        Returns None when there is no fresh data, so callers can fall back to the API.
+        """
+        if max_age is None:
+            max_age = self.config.status_check_interval
+        if time.monotonic() - self._latest_crawls_at > max_age or website_id not in self._latest_crawls:
+            return None
+        return self._website_status(website_id, {"id": website_id, "latest_crawl": self._latest_crawls[website_id]})
+
+    def _website_status(self, website_id: str, website_data: Dict) -> Dict:
+        latest_crawl = website_data.get("latest_crawl") or {}
+        
+        # Extract the status and other details from the latest crawl
+        status = latest_crawl.get("status")
+        run_id = latest_crawl.get("id")
+        
+        if status in _ACTIVE_STATUSES:
+            logger.info("%sWebsite %s already has a %s crawl (Run ID: %s)%s", YELLOW, website_id, status, run_id, RESET)
+            return {
+                "status": status,
+                "run_id": run_id,
+                "latest_crawl": latest_crawl,
+                "already_active": True
+            }
+        
+        return website_data
+
+    def _remember_latest_crawls(self, websites: List[Dict]):
+        """Keep each listed website's latest_crawl so pre-trigger checks can skip a request."""
+        self._latest_crawls = {site["id"]: site.get("latest_crawl") or {} for site in websites if site.get("id")}
+        self._latest_crawls_at = time.monotonic()
+
+    def get_websites_for_space(self) -> Tuple[List[Dict], Optional[str]]:
+        """Get websites from space data via the knowledge endpoint, with the response's ETag."""
         # Determine which space to use
         if not self.config.space_id and not self.config.space_name:
-            logger.error(f"{RED}No space_id or space_name provided{RESET}")
+            logger.error("%sNo space_id or space_name provided%s", RED, RESET)
             raise ValueError("You must provide either space_id or space_name")
 
-        space_id = self.config.space_id
+        space_id = self.space_id
         if not space_id:
             found = self.find_space_by_name(self.config.space_name)
             if not found:
-                logger.error(f"{RED}Could not find a space named '{self.config.space_name}'{RESET}")
+                logger.error("%sCould not find a space named '%s'%s", RED, self.config.space_name, RESET)
                 raise ValueError(f"Space with name '{self.config.space_name}' not found")
             space_id = found["id"]
-            self.config.space_id = space_id
+            self.space_id = space_id
 
         # Use the /knowledge/ endpoint to get websites directly
         try:
-            logger.info(f"{CYAN}Fetching websites for space: {space_id}{RESET}")
-            response = self.session.get(f"{self.config.base_url}/spaces/{space_id}/knowledge/", timeout=10)
-            if not response.ok:
-                self._handle_api_error(response)
-                
-            data = response.json()
-            websites_data = data.get("websites", {})
-            all_websites = websites_data.get("items", [])
-            logger.info(f"{CYAN}Found {len(all_websites)} website(s) in the space.{RESET}")
-            
-            # If configured to crawl all websites in the space, return all of them
-            if self.config.crawl_all_space_websites:
-                logger.info(f"{CYAN}Configured to crawl all websites in the space.{RESET}")
-                return all_websites
-            
-            # Otherwise apply filters
-            if not self.config.website_filter:
-                logger.info(f"{CYAN}No website filter specified, returning all websites.{RESET}")
-                return all_websites
-
-            # Apply filters
-            logger.info(f"{CYAN}Applying {len(self.config.website_filter)} website filters{RESET}")
-                
-            filtered = []
-            for site in all_websites:
-                site_id = str(site.get("id", "")).strip()
-                site_name = str(site.get("name", "")).strip()
-                site_url = str(site.get("url", "")).strip()
-
-                site_identifiers = {
-                    self._normalize_url(site_id),
-                    self._normalize_url(site_name),
-                    self._normalize_url(site_url)
-                }
+            logger.info("%sFetching websites for space: %s%s", CYAN, space_id, RESET)
+            # Revalidate the cached list with the server so an unchanged list skips the body and parse
+            headers = dict(self.headers)
+            cached = self._websites_cache
+            if self._websites_etag and cached and cached[1] == self._websites_cache_key():
+                headers["If-None-Match"] = self._websites_etag
+            response = self.session.get(
+                f"{self.config.base_url}/spaces/{space_id}/knowledge/",
+                headers=headers,
+                timeout=10,
+                stream=True
+            )
+            try:
+                if response.status_code == 304 and "If-None-Match" in headers:
+                    logger.info("%sWebsite list unchanged for space: %s%s", CYAN, space_id, RESET)
+                    # Unchanged body means the remembered latest_crawl data is current as well
+                    self._latest_crawls_at = time.monotonic()
+                    return list(cached[2]), self._websites_etag
+                if not response.ok:
+                    self._handle_api_error(response)
+                etag = response.headers.get("ETag")
                 
-                for filter_str in self.config.website_filter:
-                    clean_filter = self._normalize_url(filter_str)
+                # Without filters every site is kept, so parse the whole body at once
+                if self.config.crawl_all_space_websites or not self.config.website_filter:
+                    data = _loads(response)
+                    websites_data = data.get("websites", {})
+                    all_websites = websites_data.get("items", [])
+                    logger.info("%sFound %s website(s) in the space.%s", CYAN, len(all_websites), RESET)
+                    
+                    # If configured to crawl all websites in the space, return all of them
+                    if self.config.crawl_all_space_websites:
+                        logger.info("%sConfigured to crawl all websites in the space.%s", CYAN, RESET)
+                    else:
+                        logger.info("%sNo website filter specified, returning all websites.%s", CYAN, RESET)
+                    self._remember_latest_crawls(all_websites)
+                    return all_websites, etag
+
+                # Apply filters
+                logger.info("%sApplying %s website filters%s", CYAN, len(self.config.website_filter), RESET)
+                    
+                filters = self.config.normalized_filters
+
+                # Stream the site list so only matching sites are kept in memory
+                response.raw.decode_content = True
+                total = 0
+                filtered = []
+                for site in ijson.items(response.raw, "websites.items.item", use_float=True):
+                    total += 1
+                    site_identifiers = _identifiers(site)
                     
-                    # Check if URL contains the filter or filter contains the URL
-                    match_found = False
-                    for identifier in site_identifiers:
-                        if identifier and clean_filter:
-                            if clean_filter in identifier or identifier in clean_filter:
-                                match_found = True
-                                break
-                                
-                    if match_found:
+                    # Exact matches are a single set intersection; only fall back to
+                    # substring matching (URL contains filter or filter contains URL) when needed
+                    matched_filter = next(iter(site_identifiers & filters), None)
+                    if matched_filter is None:
+                        matched_filter = next(
+                            (f for f in filters for identifier in site_identifiers if f in identifier or identifier in f),
+                            None
+                        )
+
+                    if matched_filter is not None:
                         filtered.append(site)
-                        logger.info(f"{GREEN}Matched filter '{filter_str}' to site '{site_name}'{RESET}")
-                        break
+                        logger.info("%sMatched filter '%s' to site '%s'%s", GREEN, matched_filter, site.get('name', ''), RESET)
 
-            logger.info(f"{CYAN}Filter matched {len(filtered)} of {len(all_websites)} websites{RESET}")
-            return filtered
+                logger.info("%sFilter matched %s of %s websites%s", CYAN, len(filtered), total, RESET)
+                self._remember_latest_crawls(filtered)
+                return filtered, etag
+            finally:
+                response.close()
             
         except requests.RequestException as e:
-            logger.error(f"{RED}Network error fetching websites for space {space_id}: {str(e)}{RESET}")
+            logger.error("%sNetwork error fetching websites for space %s: %s%s", RED, space_id, e, RESET)
             raise
         except Exception as e:
-            logger.error(f"{RED}Unexpected error fetching websites for space {space_id}: {str(e)}{RESET}")
+            logger.error("%sUnexpected error fetching websites for space %s: %s%s", RED, space_id, e, RESET)
+            raise
+
+    def _websites_cache_key(self) -> Tuple:
+        return (
+            self.space_id,
+            self.config.space_name,
+            self.config.crawl_all_space_websites,
+            self.config.website_filter
+        )
+
+    def invalidate_websites_cache(self):
+        """Drop the cached website list so the next call fetches it from the API."""
+        self._websites_cache = None
+        self._websites_etag = None
+
+    def get_websites(self, refresh: bool = False) -> List[Dict]:
+        """
+        Get websites using the space-based approach.
+        Results are cached for schedule_minutes unless refresh is set. If a fetch fails,
+        the last list for the same space and filters is served instead (stale-while-revalidate).
+        """
+        key = self._websites_cache_key()
+        cached = self._websites_cache
+        space_label = self.config.space_name or self.space_id
+        if not refresh and cached and cached[1] == key and time.monotonic() - cached[0] < self.config.schedule_minutes * 60:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Website list cache HIT for space %s", space_label)
+            return list(cached[2])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Website list cache MISS for space %s", space_label)
+
+        try:
+            websites, etag = self.get_websites_for_space()
+        except (requests.RequestException, urllib3.exceptions.HTTPError, ijson.JSONError, orjson.JSONDecodeError) as e:
+            # The filtered list streams from response.raw, so a connection dropped or timed out mid-body
+            # raises urllib3 errors and a cut-off body ijson.JSONError; an unfiltered body fails in orjson
+            self._websites_etag = None
+            if isinstance(e, requests.HTTPError) and e.response is not None and e.response.status_code in (404, 422):
+                # The space is gone or invalid: a stale list would only trigger failing crawls
+                self.invalidate_websites_cache()
+                raise
+            if not (cached and cached[1] == key):
+                raise
+            logger.warning("%sWebsite list cache STALE for space %s, fetch failed: %s%s", YELLOW, space_label, e, RESET)
+            return list(cached[2])
+        except Exception:
+            self._websites_etag = None
             raise
 
-    def get_websites(self) -> List[Dict]:
-        """Get websites using the space-based approach."""
-        return self.get_websites_for_space()
+        # Store the ETag only with the list it was parsed from, so a failed parse can't pin an old list
+        self._websites_cache = (time.monotonic(), self._websites_cache_key(), websites)
+        self._websites_etag = etag
+        return list(websites)
 
     def trigger_crawl(self, website_id: str) -> Optional[Dict]:
         try:
-            logger.info(f"{CYAN}Triggering crawl for website {website_id}{RESET}")
-            response = self.session.post(
-                f"{self.config.base_url}/websites/{website_id}/run/",
-                data="",
-                timeout=30
-            )
+            logger.info("%sTriggering crawl for website %s%s", CYAN, website_id, RESET)
+            # Bound concurrent triggers overall and their rate per API host
+            with _TRIGGER_SEM:
+                self.trigger_limiter.acquire()
+                response = self.session.post(
+                    f"{self.config.base_url}/websites/{website_id}/run/",
+                    headers=self.headers,
+                    data="",
+                    timeout=30
+                )
             if not response.ok:
                 # This now might return a special response instead of raising an exception
                 result = self._handle_api_error(response)
@@ -581,56 +927,163 @@ class CrawlerAPIClient:
                     return result  # Return the special "already queued" response
                 # If it's another error, _handle_api_error will have raised an exception
                 
-            return response.json()
+            return _loads(response)
         except requests.RequestException as e:
-            logger.error(f"{RED}Crawl trigger failed: {str(e)}{RESET}")
+            logger.error("%sCrawl trigger failed: %s%s", RED, e, RESET)
             return None
 
+    def get_crawl_statuses(self, pairs: List[Tuple[str, str]]) -> Dict[str, str]:
+        """
+        Get the status of many runs at once, as {run_id: status}.
+        Runs are grouped by website so each website's run list is fetched only once.
+        """
+        run_ids_by_website: Dict[str, Set[str]] = {}
+        for website_id, run_id in pairs:
+            run_ids_by_website.setdefault(website_id, set()).add(run_id)
+
+        if len(run_ids_by_website) <= 1:
+            results = [self._fetch_run_statuses(w, ids) for w, ids in run_ids_by_website.items()]
+        else:
+            # Websites are independent, so fetch their run lists concurrently
+            results = API_POOL.map(lambda item: self._fetch_run_statuses(*item), run_ids_by_website.items())
+
+        statuses: Dict[str, str] = {}
+        for result in results:
+            statuses.update(result)
+        return statuses
+
+    def _fetch_run_statuses(self, website_id: str, run_ids: Set[str]) -> Dict[str, str]:
+        """Fetch one website's run list and return the statuses of the given runs."""
+        # Checks that land within a few seconds of each other share one response
+        cached = self._runs_cache.get(website_id)
+        if cached and time.monotonic() - cached[0] < self.RUNS_CACHE_TTL and run_ids <= cached[1].keys():
+            return {run_id: cached[1][run_id] for run_id in run_ids}
+
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Checking status for website_id=%s, run_ids=%s", website_id, sorted(run_ids))
+            response = self.session.get(
+                f"{self.config.base_url}/websites/{website_id}/runs/",
+                headers=self.headers,
+                timeout=10
+            )
+            if not response.ok:
+                self._handle_api_error(response)
+
+            runs_by_id = {r["id"]: r["status"] for r in _loads(response).get("items", [])}
+            self._runs_cache[website_id] = (time.monotonic(), runs_by_id)
+            return {run_id: runs_by_id[run_id] for run_id in run_ids if run_id in runs_by_id}
+        except requests.RequestException as e:
+            # Re-raise so callers (the crawl monitor) can back off instead of reading "no status"
+            logger.error("%sStatus check failed for website %s: %s%s", RED, website_id, e, RESET)
+            raise
+
     def get_crawl_status(self, website_id: str, run_id: str = None) -> Optional[str]:
         try:
             # If we have a specific run_id, check that run
             if run_id:
-                logger.debug(f"Checking status for website_id={website_id}, run_id={run_id}")
-                response = self.session.get(
-                    f"{self.config.base_url}/websites/{website_id}/runs/",
-                    timeout=10
-                )
-                if not response.ok:
-                    self._handle_api_error(response)
-
-                runs = response.json().get("items", [])
-                for r in runs:
-                    if r["id"] == run_id:
-                        return r["status"]
-                return None
+                return self.get_crawl_statuses([(website_id, run_id)]).get(run_id)
             else:
                 # Otherwise, check the website's latest crawl status
-                website_data = self.get_website_status(website_id)
-                if website_data and "latest_crawl" in website_data:
-                    return website_data["latest_crawl"].get("status")
-                return None
+                latest_run = self.get_latest_run_status(website_id)
+                return latest_run["status"] if latest_run else None
                 
         except requests.RequestException as e:
-            logger.error(f"{RED}Status check failed: {str(e)}{RESET}")
+            logger.error("%sStatus check failed: %s%s", RED, e, RESET)
             return None
 
 # ------------------- APScheduler Job Logic -------------------
-def run_crawl_for_site(config: AppConfig, api_client: CrawlerAPIClient, site: Dict, user_id: str):
-    """Run a crawl for a single site and monitor its progress"""
+def _duration_cdf(durations: List[float], upper: float, bins: int):
+    """
+    Return (cdf, pdf) functions on [0, upper] from a histogram of past crawl durations.
+    A little uniform mass is mixed in so the density is never zero (the poll recurrence divides by it).
+    """
+    width = upper / bins
+    counts = [0] * bins
+    for d in durations:
+        counts[min(bins - 1, int(d / width))] += 1
+    n = len(durations)
+    mix = 0.1
+    densities = [(1 - mix) * c / (n * width) + mix / upper for c in counts]
+    cumulative = [0.0]
+    for density in densities:
+        cumulative.append(cumulative[-1] + density * width)
+
+    def pdf(t: float) -> float:
+        return densities[min(bins - 1, max(0, int(t / width)))]
+
+    def cdf(t: float) -> float:
+        i = min(bins - 1, max(0, int(t / width)))
+        return cumulative[i] + densities[i] * (min(t, upper) - i * width)
+
+    return cdf, pdf
+
+def planned_poll_waits(site_id: str, config: AppConfig, api_client: CrawlerAPIClient):
+    """
+    Yield seconds to wait between status checks of a new crawl of this site.
+    With enough history, the k checks up to the 99th percentile U of past durations follow the
+    optimal-polling recurrence L_i = L_{i-1} + (F(L_{i-1}) - F(L_{i-2})) / p(L_{i-1}) on the
+    empirical duration distribution, with L_1 chosen so that L_k reaches U; checks then cluster
+    where crawls usually finish. After that, or without history, it falls back to poll_interval_seq().
+    """
+    durations = sorted(SITE_DURATION_HIST.get(site_id, ()))
+    if len(durations) >= SITE_DURATION_MIN_SAMPLES:
+        base = max(1, config.status_check_interval)
+        n = len(durations)
+        upper = max(1.0, durations[min(n - 1, math.ceil(0.99 * n) - 1)])
+        # Same number of checks as fixed-interval polling would use up to that point
+        k = max(1, math.ceil(upper / base))
+        cdf, pdf = _duration_cdf(durations, upper, max(1, min(k, n // SITE_DURATION_MIN_SAMPLES)))
+
+        def poll_times(first: float) -> List[float]:
+            times = [0.0, first]
+            while len(times) <= k + 1 and times[-1] < upper:
+                prev, last = times[-2], times[-1]
+                times.append(last + (cdf(last) - cdf(prev)) / pdf(last))
+            return times[1:]
+
+        # Bisect for the first check time whose sequence reaches U in k checks
+        lo, hi = 0.0, upper
+        for _ in range(40):
+            mid = (lo + hi) / 2
+            if len(poll_times(mid)) <= k:
+                hi = mid
+            else:
+                lo = mid
+
+        min_gap = max(1, base // 2)
+        elapsed = 0.0
+        for offset in [t for t in poll_times(hi)[:k - 1] if t < upper] + [upper]:
+            if offset - elapsed >= min_gap:
+                yield offset - elapsed
+                elapsed = offset
+    yield from api_client.poll_interval_seq()
+
+def start_crawl_for_site(api_client: CrawlerAPIClient, site: Dict, user_id: str) -> Optional[str]:
+    """
+    Trigger a crawl for a single site, or adopt one that is already queued/running.
+    Returns the job key to monitor, or None if there is nothing to monitor.
+    """
     site_id = site.get("id")
     site_name = site.get("name") or site_id
 
     if not site_id:
-        logger.error(f"{RED}Website missing ID, skipping...{RESET}")
-        return
+        logger.error("%sWebsite missing ID, skipping...%s", RED, RESET)
+        return None
     
+    # One timestamp for everything recorded before the crawl is triggered
+    now = datetime.now()
+
     # Initialize job status for this site if it doesn't exist
     job_key = f"{site_id}"
-    if user_id not in USER_JOB_STATUS:
-        USER_JOB_STATUS[user_id] = {}
+    user_jobs = USER_JOB_STATUS[user_id]
+    prev = user_jobs.get(job_key)
+    # Preserve last_successful_crawl if it exists
+    last_ok = prev.last_successful_crawl if prev else None
         
-    # Check the current status of the website directly to see if it's already being crawled
-    current_status = api_client.get_website_status(site_id)
+    # Check whether the website is already being crawled, reusing a fresh website listing
+    # (one request for all sites) before asking the API about this site directly
+    current_status = api_client.get_cached_status(site_id) or api_client.get_website_status(site_id)
     
     # If it's already active (queued or running), update our state and monitor it
     if current_status and current_status.get("already_active"):
@@ -638,333 +1091,651 @@ def run_crawl_for_site(config: AppConfig, api_client: CrawlerAPIClient, site: Di
         status = latest_crawl.get("status", "unknown")
         run_id = latest_crawl.get("id")
         
-        logger.info(f"{YELLOW}Website {site_name} is already {status}, will monitor existing crawl (Run ID: {run_id}){RESET}")
+        logger.info("%sWebsite %s is already %s, will monitor existing crawl (Run ID: %s)%s", YELLOW, site_name, status, run_id, RESET)
         
-        # Update our job status to match what's already happening
-        USER_JOB_STATUS[user_id][job_key] = JobStatus(
-            site_id=site_id,
-            site_name=site_name,
-            run_id=run_id,
-            status=status,
-            start_time=datetime.now(),  # We don't know the actual start time, so use now
-            last_update=datetime.now(),
-            # Preserve last_successful_crawl if it exists
-            last_successful_crawl=USER_JOB_STATUS.get(user_id, {}).get(job_key, JobStatus(site_id, site_name)).last_successful_crawl
-        )
+        if prev and run_id and prev.run_id == run_id:
+            # Still the run we already track (e.g. a schedule tick during a long crawl):
+            # keep its start time instead of restarting the job
+            job = prev
+            if job.status != status:
+                _SUMMARY.dirty = True
+            job.status = status
+            job.last_update = now
+        else:
+            if prev and prev.run_id and prev.status in _ACTIVE_STATUSES:
+                # A newer run replaced the one we track; record how that one ended first
+                prev_status = api_client.get_crawl_status(site_id, prev.run_id)
+                if prev_status and prev_status not in _ACTIVE_STATUSES:
+                    _apply_crawl_status(prev, prev_status)
+                    last_ok = prev.last_successful_crawl
+            # Update our job status to match what's already happening
+            job = JobStatus(
+                site_id=site_id,
+                site_name=site_name,
+                run_id=run_id,
+                status=status,
+                start_time=now,  # We don't know the actual start time, so use now
+                last_update=now,
+                last_successful_crawl=last_ok
+            )
+            with _user_lock(user_id):
+                user_jobs[job_key] = job
+            _SUMMARY.dirty = True
         
         # Skip to monitoring phase
         if LOG_MODE == "debug":
-            logger.info(f"{MAGENTA}Monitoring existing {status} crawl for {site_name}...{RESET}")
+            logger.info("%sMonitoring existing %s crawl for %s...%s", MAGENTA, status, site_name, RESET)
     else:
         # Check if we're in the middle of an existing job according to our state
-        job_status = USER_JOB_STATUS.get(user_id, {}).get(job_key)
-        if job_status and job_status.status in ("running", "queued"):
+        if prev and prev.status in _ACTIVE_STATUSES:
             # Double-check by getting the status from the API
-            api_status = api_client.get_crawl_status(site_id, job_status.run_id)
-            if api_status in ("running", "queued"):
-                logger.info(f"{YELLOW}Skipping crawl for {site_name} - previous crawl still {api_status}{RESET}")
+            api_status = api_client.get_crawl_status(site_id, prev.run_id)
+            if api_status in _ACTIVE_STATUSES:
+                logger.info("%sSkipping crawl for %s - previous crawl still %s%s", YELLOW, site_name, api_status, RESET)
                 
                 # Update the timestamp to indicate we checked it
-                USER_JOB_STATUS[user_id][job_key].last_update = datetime.now()
-                return
+                prev.last_update = now
+                return None
+            if api_status:
+                # The run ended while the monitor was still backing off; record it before replacing it
+                _apply_crawl_status(prev, api_status)
+                last_ok = prev.last_successful_crawl
         
         # Start a new crawl
-        USER_JOB_STATUS[user_id][job_key] = JobStatus(
+        job = JobStatus(
             site_id=site_id,
             site_name=site_name,
             status="starting",
-            start_time=datetime.now(),
-            last_update=datetime.now(),
-            # Preserve last_successful_crawl if it exists
-            last_successful_crawl=USER_JOB_STATUS.get(user_id, {}).get(job_key, JobStatus(site_id, site_name)).last_successful_crawl
+            start_time=now,
+            last_update=now,
+            last_successful_crawl=last_ok
         )
+        with _user_lock(user_id):
+            user_jobs[job_key] = job
+        _SUMMARY.dirty = True
         
         # Log start based on mode
         if LOG_MODE == "debug":
-            logger.info(f"{MAGENTA}Starting crawl job for: {site_name}{RESET}")
+            logger.info("%sStarting crawl job for: %s%s", MAGENTA, site_name, RESET)
         else:
-            logger.debug(f"Starting crawl: {site_name} ({user_id})")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Starting crawl: %s (%s)", site_name, user_id)
 
         # Trigger crawl
         try:
             resp = api_client.trigger_crawl(site_id)
+            now = datetime.now()
             if not resp:
                 error_msg = f"Failed to start crawl (API returned empty response)"
-                logger.error(f"{RED}{error_msg} for {site_name}{RESET}")
+                logger.error("%s%s for %s%s", RED, error_msg, site_name, RESET)
                 # Update job status to failed
-                USER_JOB_STATUS[user_id][job_key].status = "failed"
-                USER_JOB_STATUS[user_id][job_key].error_message = error_msg
-                USER_JOB_STATUS[user_id][job_key].end_time = datetime.now()
-                USER_JOB_STATUS[user_id][job_key].last_update = datetime.now()
+                job.status = "failed"
+                _SUMMARY.dirty = True
+                job.error_message = error_msg
+                job.end_time = now
+                job.last_update = now
                 
-                # Update status summary immediately when a job fails in production mode
+                # Update status summary soon when a job fails in production mode
                 if LOG_MODE == "production":
-                    generate_user_status_summary()
-                return
+                    request_status_summary()
+                return None
             
             # Special handling for "already queued" response
             if resp.get("already_queued"):
-                logger.info(f"{YELLOW}Crawl for {site_name} is already queued/in progress, monitoring status...{RESET}")
-                USER_JOB_STATUS[user_id][job_key].status = "queued"
-                USER_JOB_STATUS[user_id][job_key].last_update = datetime.now()
+                logger.info("%sCrawl for %s is already queued/in progress, monitoring status...%s", YELLOW, site_name, RESET)
+                job.status = "queued"
+                _SUMMARY.dirty = True
+                job.last_update = now
                 # Continue to the status monitoring loop - no run_id but we can
                 # still poll for the latest runs for this site
                 run_id = None
             else:
                 run_id = resp.get("id")
-                USER_JOB_STATUS[user_id][job_key].run_id = run_id
-                USER_JOB_STATUS[user_id][job_key].status = "running"
-                USER_JOB_STATUS[user_id][job_key].last_update = datetime.now()
+                job.run_id = run_id
+                job.triggered = True
+                job.status = "running"
+                _SUMMARY.dirty = True
+                job.last_update = now
                 
                 # Log differently based on mode
                 if LOG_MODE == "debug":
-                    logger.info(f"{GREEN}Started crawl for {site_name} (Run ID: {run_id}){RESET}")
+                    logger.info("%sStarted crawl for %s (Run ID: %s)%s", GREEN, site_name, run_id, RESET)
             
         except Exception as e:
             error_msg = f"Error triggering crawl: {str(e)}"
-            logger.error(f"{RED}{error_msg} for {site_name}{RESET}")
+            logger.error("%s%s for %s%s", RED, error_msg, site_name, RESET)
             # Update job status to failed
-            USER_JOB_STATUS[user_id][job_key].status = "failed"
-            USER_JOB_STATUS[user_id][job_key].error_message = error_msg
-            USER_JOB_STATUS[user_id][job_key].end_time = datetime.now()
-            USER_JOB_STATUS[user_id][job_key].last_update = datetime.now()
+            now = datetime.now()
+            job.status = "failed"
+            _SUMMARY.dirty = True
+            job.error_message = error_msg
+            job.end_time = now
+            job.last_update = now
             
-            # Update status summary immediately when a job fails in production mode
+            # Update status summary soon when a job fails in production mode
             if LOG_MODE == "production":
-                generate_user_status_summary()
-            return
+                request_status_summary()
+            return None
 
-    # In debug mode only, show detailed monitoring message
-    if LOG_MODE == "debug":
-        logger.info(f"{MAGENTA}Monitoring crawl status for {site_name}...{RESET}")
+    return job_key
+
+def _apply_crawl_status(job: JobStatus, status: Optional[str]) -> bool:
+    """Record a polled crawl status for a job. Returns True while the crawl is still active."""
+    site_name = job.site_name
+    now = datetime.now()
+    job.last_update = now
+    
+    if not status:
+        # Only log "status not available" in debug mode
+        if LOG_MODE == "debug":
+            logger.info("%sStatus not available yet for %s%s", YELLOW, site_name, RESET)
+        return True
+        
+    if job.status != status:
+        _SUMMARY.dirty = True
+    job.status = status
     
-    # Monitor the crawl until it completes or fails
-    active = True
-    while active:
+    if status == "complete":
+        logger.info("%sCompleted crawl for %s (Run ID: %s)%s", GREEN, site_name, job.run_id, RESET)
+        job.end_time = now
+        job.last_successful_crawl = now
+        # Adopted runs only know when we first saw them, which would skew the history short
+        if job.triggered and job.start_time:
+            SITE_DURATION_HIST.setdefault(job.site_id, deque(maxlen=SITE_DURATION_SAMPLES)).append(
+                (now - job.start_time).total_seconds()
+            )
+        
+        # In production mode, only update the summary if enough time has passed
+        if LOG_MODE == "production":
+            if (now - _SUMMARY.last_time).total_seconds() > 60:
+                request_status_summary()
+        return False
+            
+    if status in _FAILED_STATUSES:
+        error_msg = f"Crawl {status}"
+        logger.error("%s%s for %s (Run ID: %s)%s", RED, error_msg, site_name, job.run_id, RESET)
+        job.error_message = error_msg
+        job.end_time = now
+        
+        # Always update on failures
+        if LOG_MODE == "production":
+            request_status_summary()
+        return False
+        
+    # Only log intermediate statuses in debug mode
+    if LOG_MODE == "debug":
+        logger.info("%s%s status: %s%s", CYAN, site_name, status, RESET)
+    return True
+
+class CrawlMonitor:
+    """
+    Tracks every in-flight crawl run from a single background thread.
+    Runs are kept in a min-heap of next-check deadlines, so only runs that are due get
+    polled, and each run backs off on its own while its status is unchanged.
+    Failed checks back off separately, up to ERROR_BACKOFF_MAX seconds.
+    Due runs are polled per user on a small worker pool, at most one poll per user at a time.
+    """
+    ERROR_BACKOFF_MAX = 60
+
+    def __init__(self):
+        self._heap: List[Tuple[float, str, str]] = []
+        self._runs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Not API_POOL: status batches fan out on API_POOL, and waiting on it from its own workers could deadlock
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=MONITOR_WORKERS, thread_name_prefix="monitor")
+        # Users with a poll in flight, and their runs that fell due meanwhile
+        self._polling: Set[str] = set()
+        self._deferred: Dict[str, List[str]] = {}
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="crawl-monitor", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5):
+        """Wake the monitor thread and wait for it to exit."""
+        with self._cond:
+            self._stop.set()
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def add(self, config: AppConfig, api_client: CrawlerAPIClient, user_id: str, job_key: str):
+        """
+        Start monitoring a job's crawl run. A job that is already monitored is left alone;
+        if the key now holds a different JobStatus (a new run), its entry starts over.
+        """
+        with self._cond:
+            job = USER_JOB_STATUS[user_id][job_key]
+            current = self._runs.get((user_id, job_key))
+            if current and current["job"] is job:
+                return
+            # In debug mode only, show detailed monitoring message
+            if LOG_MODE == "debug":
+                logger.info("%sMonitoring crawl status for %s...%s", MAGENTA, job.site_name, RESET)
+            site_id = job.site_id
+            run = self._runs[(user_id, job_key)] = {
+                "job": job,
+                "config": config,
+                "api_client": api_client,
+                "poll_intervals": planned_poll_waits(site_id, config, api_client),
+                "planned": len(SITE_DURATION_HIST.get(site_id, ())) >= SITE_DURATION_MIN_SAMPLES,
+                "error_intervals": None,
+                "last_status": None,
+                "due": 0.0
+            }
+            self._push(user_id, job_key, run, time.monotonic())
+            self._cond.notify()
+
+    def _push(self, user_id: str, job_key: str, run: Dict[str, Any], deadline: float):
+        # Only the latest deadline per run counts; older heap entries are skipped when popped
+        run["due"] = deadline
+        heapq.heappush(self._heap, (deadline, user_id, job_key))
+
+    def _schedule(self, user_id: str, job_key: str, run: Dict[str, Any], delay: float):
+        with self._cond:
+            # The run may have been finished or replaced by add() while it was being polled
+            if self._runs.get((user_id, job_key)) is run:
+                self._push(user_id, job_key, run, time.monotonic() + delay)
+
+    def _retry_after_error(self, user_id: str, job_key: str, run: Dict[str, Any]):
+        """Reschedule a run whose status check failed, doubling the delay on repeated failures."""
+        if run["error_intervals"] is None:
+            base = run["config"].status_check_interval
+            run["error_intervals"] = run["api_client"].poll_interval_seq(max(self.ERROR_BACKOFF_MAX, base))
+        self._schedule(user_id, job_key, run, next(run["error_intervals"]))
+
+    def _finish(self, user_id: str, job_key: str, run: Dict[str, Any]):
+        with self._cond:
+            if self._runs.get((user_id, job_key)) is run:
+                del self._runs[(user_id, job_key)]
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._cond:
+                # Block without waking until a run is due, a run is added, or stop() is called
+                while not self._stop.is_set() and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    timeout = self._heap[0][0] - time.monotonic() if self._heap else None
+                    self._cond.wait(timeout)
+                if self._stop.is_set():
+                    return
+                now = time.monotonic()
+                due: Dict[str, List[str]] = {}
+                while self._heap and self._heap[0][0] <= now:
+                    deadline, user_id, job_key = heapq.heappop(self._heap)
+                    run = self._runs.get((user_id, job_key))
+                    if run is None or run["due"] != deadline:
+                        continue
+                    if user_id in self._polling:
+                        self._deferred.setdefault(user_id, []).append(job_key)
+                    else:
+                        due.setdefault(user_id, []).append(job_key)
+                self._polling.update(due)
+
+            for user_id, job_keys in due.items():
+                self._pool.submit(self._poll_user_guarded, user_id, job_keys)
+
+    def _poll_user_guarded(self, user_id: str, job_keys: List[str]):
         try:
-            # If we have a run_id, check that specific run. Otherwise, check latest status.
-            if USER_JOB_STATUS[user_id][job_key].run_id:
-                status = api_client.get_crawl_status(site_id, USER_JOB_STATUS[user_id][job_key].run_id)
-            else:
-                # When run_id is not available, check the website's latest crawl
-                website_data = api_client.get_website_status(site_id)
-                if website_data and "latest_crawl" in website_data:
-                    latest_crawl = website_data["latest_crawl"]
-                    status = latest_crawl.get("status")
+            self._poll_user(user_id, job_keys)
+        except Exception as e:
+            # Never let one bad poll kill the worker; drop the runs so they can be re-added
+            logger.error("%sCrawl monitor error for user %s: %s%s", RED, user_id, e, RESET)
+            for job_key in job_keys:
+                run = self._runs.get((user_id, job_key))
+                if run:
+                    self._finish(user_id, job_key, run)
+        finally:
+            with self._cond:
+                self._polling.discard(user_id)
+                # Runs that fell due during this poll are checked right away
+                now = time.monotonic()
+                for job_key in self._deferred.pop(user_id, ()):
+                    run = self._runs.get((user_id, job_key))
+                    if run:
+                        self._push(user_id, job_key, run, now)
+                self._cond.notify()
+
+    def _poll_user(self, user_id: str, job_keys: List[str]):
+        """Check all due runs for one user, fetching statuses for known run_ids in one go."""
+        jobs = USER_JOB_STATUS.get(user_id, {})
+        run_pairs = [(jobs[k].site_id, jobs[k].run_id) for k in job_keys if k in jobs and jobs[k].run_id]
+        api_client = self._runs[(user_id, job_keys[0])]["api_client"]
+        batch_failed = False
+        try:
+            run_statuses = api_client.get_crawl_statuses(run_pairs) if run_pairs else {}
+        except Exception as e:
+            logger.error("%sStatus check error for user %s: %s%s", RED, user_id, e, RESET)
+            run_statuses = {}
+            batch_failed = True
+
+        # Runs without a run_id are looked up by website; fetch those concurrently as well
+        def latest_run_status(site_id: str):
+            try:
+                return api_client.get_latest_run_status(site_id)
+            except Exception as e:
+                return e
+        pending = [k for k in job_keys if k in jobs and not jobs[k].run_id]
+        if len(pending) > 1:
+            latest_runs = dict(zip(pending, API_POOL.map(latest_run_status, [jobs[k].site_id for k in pending])))
+        else:
+            latest_runs = {k: latest_run_status(jobs[k].site_id) for k in pending}
+
+        for job_key in job_keys:
+            run = self._runs[(user_id, job_key)]
+            job = jobs.get(job_key)
+            if job is not run["job"]:
+                # The user's state was reset (e.g. config replaced) or a new run replaced this one
+                self._finish(user_id, job_key, run)
+                continue
+            site_name = job.site_name
+            try:
+                # If we have a run_id, check that specific run. Otherwise, check latest status.
+                if job.run_id:
+                    if batch_failed:
+                        # The run list could not be fetched; don't mistake that for "no status"
+                        self._retry_after_error(user_id, job_key, run)
+                        continue
+                    status = run_statuses.get(job.run_id)
+                else:
+                    # When run_id is not available, the website's latest run gives both id and status
+                    latest_run = latest_runs.get(job_key)
+                    if isinstance(latest_run, Exception):
+                        raise latest_run
+                    status = latest_run["status"] if latest_run else None
                     # Update the run_id if we find it
-                    if "id" in latest_crawl and latest_crawl["status"] in ("queued", "running"):
-                        USER_JOB_STATUS[user_id][job_key].run_id = latest_crawl["id"]
+                    if status in _ACTIVE_STATUSES and latest_run["id"]:
+                        job.run_id = latest_run["id"]
                         if LOG_MODE == "debug":
-                            logger.info(f"{GREEN}Found active run {latest_crawl['id']} for {site_name}{RESET}")
-                else:
-                    status = None
+                            logger.info("%sFound active run %s for %s%s", GREEN, latest_run['id'], site_name, RESET)
                 
-            USER_JOB_STATUS[user_id][job_key].last_update = datetime.now()
-            
-            if not status:
-                # Only log "status not available" in debug mode
-                if LOG_MODE == "debug":
-                    logger.info(f"{YELLOW}Status not available yet for {site_name}{RESET}")
-            else:
-                USER_JOB_STATUS[user_id][job_key].status = status
+                run["error_intervals"] = None
+                # Reset the backoff whenever the crawl changes state (planned checks keep their schedule)
+                if status != run["last_status"]:
+                    if not run["planned"]:
+                        run["poll_intervals"] = run["api_client"].poll_interval_seq()
+                    run["last_status"] = status
                 
-                if status == "complete":
-                    logger.info(f"{GREEN}Completed crawl for {site_name} (Run ID: {USER_JOB_STATUS[user_id][job_key].run_id}){RESET}")
-                    USER_JOB_STATUS[user_id][job_key].end_time = datetime.now()
-                    USER_JOB_STATUS[user_id][job_key].last_successful_crawl = datetime.now()
-                    active = False
-                    
-                    # In production mode, only update the summary if enough time has passed
-                    if LOG_MODE == "production":
-                        last_summary_time = getattr(generate_user_status_summary, "last_summary_time", datetime.min)
-                        if (datetime.now() - last_summary_time).total_seconds() > 60:
-                            generate_user_status_summary()
-                        
-                elif status in ("failed", "cancelled"):
-                    error_msg = f"Crawl {status}"
-                    logger.error(f"{RED}{error_msg} for {site_name} (Run ID: {USER_JOB_STATUS[user_id][job_key].run_id}){RESET}")
-                    USER_JOB_STATUS[user_id][job_key].status = status
-                    USER_JOB_STATUS[user_id][job_key].error_message = error_msg
-                    USER_JOB_STATUS[user_id][job_key].end_time = datetime.now()
-                    active = False
-                    
-                    # Always update on failures
-                    if LOG_MODE == "production":
-                        generate_user_status_summary()
-                        
-                else:
-                    # Only log intermediate statuses in debug mode
+                if _apply_crawl_status(job, status):
+                    wait_seconds = next(run["poll_intervals"])
+                    # In debug mode, log wait message
                     if LOG_MODE == "debug":
-                        logger.info(f"{CYAN}{site_name} status: {status}{RESET}")
-
-            if active:
-                # In debug mode, log wait message
-                if LOG_MODE == "debug":
-                    logger.info(f"{MAGENTA}Waiting {config.status_check_interval}s before next status check for {site_name}...{RESET}")
-                time.sleep(config.status_check_interval)
+                        logger.info("%sWaiting %ss before next status check for %s...%s", MAGENTA, wait_seconds, site_name, RESET)
+                    self._schedule(user_id, job_key, run, wait_seconds)
+                    continue
+                    
+            except Exception as e:
+                error_msg = f"Status check error: {str(e)}"
+                logger.error("%s%s for %s%s", RED, error_msg, site_name, RESET)
+                # Just log the error but don't update status yet - retry with backoff
+                self._retry_after_error(user_id, job_key, run)
+                continue
+            
+            self._finish(user_id, job_key, run)
+            
+            # Final status update
+            if job.status == "running":
+                job.status = "unknown"
+                _SUMMARY.dirty = True
+                job.error_message = "Final status unknown"
+                
+            # In debug mode only, show job finished message
+            if LOG_MODE == "debug":
+                logger.info("%sCrawl job finished for %s!%s", GREEN, site_name, RESET)
 
-        except Exception as e:
-            error_msg = f"Status check error: {str(e)}"
-            logger.error(f"{RED}{error_msg} for {site_name}{RESET}")
-            # Just log the error but don't update status yet - retry on next loop
-            time.sleep(config.status_check_interval)
-
-    # Final status update
-    if USER_JOB_STATUS[user_id][job_key].status == "running":
-        USER_JOB_STATUS[user_id][job_key].status = "unknown"
-        USER_JOB_STATUS[user_id][job_key].error_message = "Final status unknown"
-        
-    # In debug mode only, show job finished message
-    if LOG_MODE == "debug":
-        logger.info(f"{GREEN}Crawl job finished for {site_name}!{RESET}")
+def run_crawl_for_site(config: AppConfig, api_client: CrawlerAPIClient, site: Dict, user_id: str):
+    """Run a crawl for a single site and hand it to the crawl monitor to track its progress"""
+    # The scheduled job and a /test run can fire for the same site at once; only one may trigger
+    lock = JOB_LOCKS.setdefault((user_id, site.get("id")), threading.Lock())
+    if not lock.acquire(blocking=False):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Crawl for %s (%s) is already being started, skipping", site.get('name') or site.get('id'), user_id)
+        return
+    try:
+        job_key = start_crawl_for_site(api_client, site, user_id)
+        if job_key:
+            crawl_monitor.add(config, api_client, user_id, job_key)
+    finally:
+        lock.release()
 
 def run_all_sites_once(config: AppConfig, api_client: CrawlerAPIClient, user_id: str):
     """Run a one-time crawl for all matching sites for a user"""
     # Log based on mode
     if LOG_MODE == "debug":
-        logger.info(f"{YELLOW}=== TEST MODE (single aggregated run) ==={RESET}")
+        logger.info("%s=== TEST MODE (single aggregated run) ===%s", YELLOW, RESET)
     else:
-        logger.info(f"Starting test mode for user {user_id}")
+        logger.info("Starting test mode for user %s", user_id)
         
     try:
         websites = api_client.get_websites()
     except Exception as e:
-        logger.error(f"{RED}Failed to fetch websites in test mode: {str(e)}{RESET}")
+        logger.error("%sFailed to fetch websites in test mode: %s%s", RED, e, RESET)
         return
 
     if not websites:
-        logger.warning(f"{YELLOW}No websites matched filter criteria.{RESET}")
+        logger.warning("%sNo websites matched filter criteria.%s", YELLOW, RESET)
         return
 
     # Log websites based on mode
     if LOG_MODE == "debug":
-        logger.info(f"{CYAN}Found {len(websites)} websites for test mode: {[w.get('name', w.get('id')) for w in websites]}{RESET}")
+        logger.info("%sFound %s websites for test mode: %s%s", CYAN, len(websites), [w.get('name', w.get('id')) for w in websites], RESET)
     else:
-        logger.info(f"Found {len(websites)} websites to crawl for user {user_id}")
+        logger.info("Found %s websites to crawl for user %s", len(websites), user_id)
         
-    for site in websites:
-        run_crawl_for_site(config, api_client, site, user_id)
+    # Trigger sites concurrently; the crawl monitor tracks the runs in the background
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_SITES, len(websites))) as executor:
+        futures = [executor.submit(run_crawl_for_site, config, api_client, site, user_id) for site in websites]
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("%sTest mode crawl failed: %s%s", RED, e, RESET)
         
     # Final log based on mode
     if LOG_MODE == "debug":
-        logger.info(f"{YELLOW}=== TEST COMPLETE ==={RESET}")
+        logger.info("%s=== TEST CRAWLS TRIGGERED (monitoring in background) ===%s", YELLOW, RESET)
     else:
-        logger.info(f"Test mode completed for user {user_id}")
+        logger.info("Test mode crawls triggered for user %s", user_id)
 
 # ------------------- User Management Functions -------------------
+def _config_from_entry(api_key: str, base_url: str, entry: Dict) -> AppConfig:
+    """Build an AppConfig from a users.json user entry or one of its spaces"""
+    # Keep filters as a frozenset of non-empty strings, normalized like /config does
+    website_filter = entry.get("website_filter")
+    if isinstance(website_filter, list):
+        website_filter = frozenset(filter(None, (w.strip().lower().rstrip('/') for w in website_filter if isinstance(w, str))))
+    else:
+        website_filter = frozenset()
+    return AppConfig(
+        api_key=api_key,  # Use the API key from the user configuration
+        base_url=base_url,
+        schedule_minutes=entry.get("schedule_minutes", 5),
+        website_filter=website_filter,
+        status_check_interval=entry.get("status_check_interval", 60),
+        space_id=entry.get("space_id"),
+        space_name=entry.get("space_name"),
+        crawl_all_space_websites=entry.get("crawl_all_space_websites", False)
+    )
+
+def add_user_config(user_id: str, config: AppConfig):
+    """Store a user's config and index it under its base user id for the summary."""
+    if user_id not in USER_CONFIGS:
+        # Handle "user_spaceN" format by extracting base user id
+        base_user_id = user_id.split("_space")[0]
+        USER_GROUPS.setdefault(base_user_id, []).append(user_id)
+    USER_CONFIGS[user_id] = config
+    _SUMMARY.dirty = True
+
 def load_users_from_json():
     """Load initial user configurations from users.json file"""
     users_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "users.json")
     
     if not os.path.exists(users_file):
-        logger.info(f"{YELLOW}No users.json file found, skipping initial user configuration{RESET}")
+        logger.info("%sNo users.json file found, skipping initial user configuration%s", YELLOW, RESET)
         return
     
     try:
-        with open(users_file, 'r') as f:
-            users_data = json.load(f)
+        users_data = orjson.loads(pathlib.Path(users_file).read_bytes())
         
         users = users_data.get("users", [])
         if not users:
-            logger.info(f"{YELLOW}No users defined in users.json{RESET}")
+            logger.info("%sNo users defined in users.json%s", YELLOW, RESET)
             return
             
-        logger.info(f"{GREEN}Loading {len(users)} users from users.json{RESET}")
+        logger.info("%sLoading %s users from users.json%s", GREEN, len(users), RESET)
         
         # Process each user
         for user_config in users:
             user_id = user_config.get("user_id")
             if not user_id:
-                logger.warning(f"{YELLOW}Skipping user with missing ID in users.json{RESET}")
+                logger.warning("%sSkipping user with missing ID in users.json%s", YELLOW, RESET)
                 continue
                 
             # Make sure we're using the right API key for this user
             api_key = user_config.get("api_key", "").strip()
             if not api_key or not api_key.startswith("inp_"):
-                logger.warning(f"{YELLOW}Invalid API key for user {user_id}, skipping{RESET}")
+                logger.warning("%sInvalid API key for user %s, skipping%s", YELLOW, user_id, RESET)
                 continue
                 
+            base_url = user_config.get("base_url", "https://sundsvall.backend.intric.ai/api/v1")
+
             # Check for spaces
             if "spaces" in user_config and isinstance(user_config["spaces"], list):
                 spaces = user_config["spaces"]
-                logger.debug(f"{BLUE}Found {len(spaces)} spaces for user {user_id}{RESET}")
+                logger.debug("%sFound %s spaces for user %s%s", BLUE, len(spaces), user_id, RESET)
                 
                 # Create a separate configuration for each space
                 for i, space in enumerate(spaces):
                     # Use a unique ID for each space configuration
                     space_user_id = user_id if len(spaces) == 1 else f"{user_id}_space{i+1}"
                     
-                    # Make sure filters are stored as a set of strings
-                    website_filter = set()
-                    if "website_filter" in space and isinstance(space["website_filter"], list):
-                        website_filter = {w.strip() for w in space["website_filter"] if isinstance(w, str) and w.strip()}
-                    
                     # Create user config for this space - ensure we use the correct API key
-                    USER_CONFIGS[space_user_id] = AppConfig(
-                        api_key=api_key,  # Use the API key from the user configuration
-                        base_url=user_config.get("base_url", "https://sundsvall.backend.intric.ai/api/v1"),
-                        schedule_minutes=space.get("schedule_minutes", 5),
-                        website_filter=website_filter,
-                        status_check_interval=space.get("status_check_interval", 60),
-                        space_id=space.get("space_id"),
-                        space_name=space.get("space_name"),
-                        crawl_all_space_websites=space.get("crawl_all_space_websites", False)
-                    )
+                    config = _config_from_entry(api_key, base_url, space)
+                    add_user_config(space_user_id, config)
                     
                     USER_API_CLIENTS[space_user_id] = CrawlerAPIClient(USER_CONFIGS[space_user_id])
                     USER_WEBSITES[space_user_id] = []
                     USER_JOBS_CREATED[space_user_id] = False
                     
                     if LOG_MODE == "debug":
-                        logger.debug(f"{GREEN}Configured user {space_user_id} with space {space.get('space_name', space.get('space_id', 'unknown'))}{RESET}")
-                        if website_filter:
-                            logger.debug(f"{CYAN}Website filters for {space_user_id}: {list(website_filter)[:2]}... (total: {len(website_filter)}){RESET}")
+                        logger.debug("%sConfigured user %s with space %s%s", GREEN, space_user_id, space.get('space_name', space.get('space_id', 'unknown')), RESET)
+                        if config.website_filter:
+                            logger.debug("%sWebsite filters for %s: %s... (total: %s)%s", CYAN, space_user_id, list(config.website_filter)[:2], len(config.website_filter), RESET)
             else:
                 # Single space configuration - ensure we use the correct API key
-                USER_CONFIGS[user_id] = AppConfig(
-                    api_key=api_key,  # Use the API key from the user configuration
-                    base_url=user_config.get("base_url", "https://sundsvall.backend.intric.ai/api/v1"),
-                    schedule_minutes=user_config.get("schedule_minutes", 5),
-                    website_filter=set(user_config.get("website_filter", [])),
-                    status_check_interval=user_config.get("status_check_interval", 60),
-                    space_id=user_config.get("space_id"),
-                    space_name=user_config.get("space_name"),
-                    crawl_all_space_websites=user_config.get("crawl_all_space_websites", False)
-                )
+                add_user_config(user_id, _config_from_entry(api_key, base_url, user_config))
                 
                 USER_API_CLIENTS[user_id] = CrawlerAPIClient(USER_CONFIGS[user_id])
                 USER_WEBSITES[user_id] = []
                 USER_JOBS_CREATED[user_id] = False
         
-        logger.info(f"{GREEN}Successfully loaded {len(USER_CONFIGS)} user configurations from users.json{RESET}")
+        logger.info("%sSuccessfully loaded %s user configurations from users.json%s", GREEN, len(USER_CONFIGS), RESET)
         
-    except json.JSONDecodeError:
-        logger.error(f"{RED}Invalid JSON format in users.json file{RESET}")
+    except orjson.JSONDecodeError:
+        logger.error("%sInvalid JSON format in users.json file%s", RED, RESET)
     except Exception as e:
-        logger.error(f"{RED}Error loading users from users.json: {str(e)}{RESET}")
+        logger.error("%sError loading users from users.json: %s%s", RED, e, RESET)
+
+def add_user_job(user_id: str, func, *args, **kwargs):
+    """Add a scheduler job for a user and index its id, so the user's jobs can be found without a scan"""
+    # Run the user's jobs on their own executor; the default pool stays free for management jobs
+    alias = f"user:{user_id}"
+    with _user_lock(user_id):
+        if user_id not in USER_EXECUTORS:
+            USER_EXECUTORS[user_id] = ThreadPoolExecutor(USER_EXECUTOR_WORKERS)
+            scheduler.add_executor(USER_EXECUTORS[user_id], alias=alias)
+    job = scheduler.add_job(func, *args, executor=alias, **kwargs)
+    USER_JOB_IDS.setdefault(user_id, set()).add(kwargs["id"])
+    return job
+
+def scheduled_job_count() -> int:
+    """Number of scheduled jobs, counted from the job id indexes rather than by listing every Job"""
+    return len(SYSTEM_JOB_IDS) + sum(map(len, list(USER_JOB_IDS.values())))
 
 def clear_jobs(user_id: str):
     """Remove all jobs for a specific user from APScheduler"""
     global USER_JOBS_CREATED
-    user_job_prefix = f"{user_id}_crawl_"
     
-    for job in scheduler.get_jobs():
-        if job.id.startswith(user_job_prefix):
-            logger.info(f"{RED}Removing job: {job.id}{RESET}")
-            scheduler.remove_job(job.id)
+    for job_id in USER_JOB_IDS.pop(user_id, set()):
+        logger.info("%sRemoving job: %s%s", RED, job_id, RESET)
+        try:
+            scheduler.remove_job(job_id)
+        except JobLookupError:
+            pass
+
+    # Drop the user's executor without waiting for a trigger that is still in flight
+    with _user_lock(user_id):
+        executor = USER_EXECUTORS.pop(user_id, None)
+        if executor is not None:
+            scheduler.remove_executor(f"user:{user_id}", shutdown=False)
+            executor.shutdown(wait=False)
 
     USER_JOBS_CREATED[user_id] = False
 
     # Set all job statuses to stopped
-    if user_id in USER_JOB_STATUS:
-        for site_id in USER_JOB_STATUS[user_id]:
-            USER_JOB_STATUS[user_id][site_id].status = "stopped"
-            USER_JOB_STATUS[user_id][site_id].end_time = datetime.now()
-            USER_JOB_STATUS[user_id][site_id].last_update = datetime.now()
+    now = datetime.now()
+    for job in snapshot_user_jobs(user_id):
+        job.status = "stopped"
+        _SUMMARY.dirty = True
+        job.end_time = now
+        job.last_update = now
+
+def _schedule_site_jobs(user_id: str, websites: List[Dict], max_stagger: Optional[float] = None) -> List[JobStatus]:
+    """
+    Schedule an interval crawl job for each website of a user, with staggered first runs.
+    First runs are spread over the schedule window, or over max_stagger seconds if that is shorter.
+    Returns the (idle) job statuses of the sites that were scheduled.
+    """
+    config = USER_CONFIGS[user_id]
+    user_jobs = USER_JOB_STATUS[user_id]
+    # Bind the shared config and client once rather than per job
+    crawl_job = functools.partial(run_crawl_for_site, config, USER_API_CLIENTS[user_id])
+    window = config.schedule_minutes * 60
+    if max_stagger is not None:
+        window = min(window, max_stagger)
+
+    scheduled = []
+    now = datetime.now()
+    for site in websites:
+        site_id = site.get("id")
+        if not site_id:
+            continue
+
+        # Initialize job status
+        job = JobStatus(
+            site_id=site_id,
+            site_name=site.get("name") or site_id,
+            status="idle",
+            last_update=now
+        )
+        with _user_lock(user_id):
+            user_jobs[site_id] = job
+        _SUMMARY.dirty = True
+        scheduled.append(job)
+
+        add_user_job(
+            user_id,
+            crawl_job,
+            "interval",
+            minutes=config.schedule_minutes,
+            args=[site, user_id],
+            id=f"{user_id}_crawl_{site_id}",
+            # Random stagger so the sites don't all hit the API at once
+            next_run_time=now + timedelta(seconds=random.uniform(0, window)),
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=600,
+            replace_existing=True
+        )
+    return scheduled
 
 def start_configured_users():
     """Start crawling for all configured users from users.json"""
-    logger.info(f"{GREEN}Starting crawlers for {len(USER_CONFIGS)} configured users...{RESET}")
+    logger.info("%sStarting crawlers for %s configured users...%s", GREEN, len(USER_CONFIGS), RESET)
     
     for user_id in list(USER_CONFIGS.keys()):
         try:
@@ -974,57 +1745,21 @@ def start_configured_users():
                 USER_WEBSITES[user_id] = websites
                 
                 if not websites:
-                    logger.warning(f"{YELLOW}No websites found for {user_id}, not scheduling jobs{RESET}")
+                    logger.warning("%sNo websites found for %s, not scheduling jobs%s", YELLOW, user_id, RESET)
                     continue
                 
-                # Initialize job status tracking for this user
-                if user_id not in USER_JOB_STATUS:
-                    USER_JOB_STATUS[user_id] = {}
-
-                # Schedule jobs for each site with staggered start times
-                for i, site in enumerate(websites):
-                    site_id = site.get("id")
-                    site_name = site.get("name", "Unknown") or site_id
-                    
-                    if not site_id:
-                        continue
-                        
-                    # Initialize job status
-                    USER_JOB_STATUS[user_id][site_id] = JobStatus(
-                        site_id=site_id,
-                        site_name=site_name,
-                        status="idle",
-                        last_update=datetime.now()
-                    )
-                    
-                    job_id = f"{user_id}_crawl_{site_id}"
-                    
-                    # Stagger initial runs to avoid overloading
-                    stagger_seconds = min(i * 20, 300)
-                    next_run_time = datetime.now() + timedelta(seconds=stagger_seconds)
-                    
-                    scheduler.add_job(
-                        run_crawl_for_site,
-                        "interval",
-                        minutes=USER_CONFIGS[user_id].schedule_minutes,
-                        args=[USER_CONFIGS[user_id], USER_API_CLIENTS[user_id], site, user_id],
-                        id=job_id,
-                        next_run_time=next_run_time,
-                        max_instances=1,
-                        coalesce=True,
-                        misfire_grace_time=600
-                    )
-                
+                # Schedule jobs for each site, spreading initial runs over the schedule window
+                _schedule_site_jobs(user_id, websites)
                 USER_JOBS_CREATED[user_id] = True
-                logger.info(f"{GREEN}Scheduled {len(websites)} sites for user {user_id}{RESET}")
+                logger.info("%sScheduled %s sites for user %s%s", GREEN, len(websites), user_id, RESET)
                 
         except Exception as e:
-            logger.error(f"{RED}Error starting crawler for {user_id}: {str(e)}{RESET}")
+            logger.error("%sError starting crawler for %s: %s%s", RED, user_id, e, RESET)
 
 def refresh_websites_for_user(user_id: str):
     """Refresh the website list for a user and schedule new websites"""
     if user_id not in USER_CONFIGS or user_id not in USER_API_CLIENTS:
-        logger.warning(f"{YELLOW}Cannot refresh websites for unknown user {user_id}{RESET}")
+        logger.warning("%sCannot refresh websites for unknown user %s%s", YELLOW, user_id, RESET)
         return
         
     try:
@@ -1032,7 +1767,7 @@ def refresh_websites_for_user(user_id: str):
         current_websites = set(site.get("id") for site in USER_WEBSITES.get(user_id, []) if site.get("id"))
         
         # Fetch the latest websites from the API
-        latest_websites = USER_API_CLIENTS[user_id].get_websites()
+        latest_websites = USER_API_CLIENTS[user_id].get_websites(refresh=True)
         USER_WEBSITES[user_id] = latest_websites
         
         # Find new websites that weren't scheduled before
@@ -1043,59 +1778,23 @@ def refresh_websites_for_user(user_id: str):
                 new_websites.append(site)
                 
         if new_websites:
-            logger.info(f"{GREEN}Found {len(new_websites)} new websites for user {user_id}, scheduling them now{RESET}")
+            logger.info("%sFound %s new websites for user %s, scheduling them now%s", GREEN, len(new_websites), user_id, RESET)
             
-            # Initialize job status tracking if needed
-            if user_id not in USER_JOB_STATUS:
-                USER_JOB_STATUS[user_id] = {}
-                
-            # Schedule new websites
-            for i, site in enumerate(new_websites):
-                site_id = site.get("id")
-                site_name = site.get("name", "Unknown") or site_id
-                
-                if not site_id:
-                    continue
-                    
-                # Initialize job status
-                USER_JOB_STATUS[user_id][site_id] = JobStatus(
-                    site_id=site_id,
-                    site_name=site_name,
-                    status="idle",
-                    last_update=datetime.now()
-                )
-                
-                job_id = f"{user_id}_crawl_{site_id}"
-                
-                # Start with a small stagger to avoid all hitting at once
-                stagger_seconds = min(i * 10, 120)
-                next_run_time = datetime.now() + timedelta(seconds=stagger_seconds)
-                
-                scheduler.add_job(
-                    run_crawl_for_site,
-                    "interval",
-                    minutes=USER_CONFIGS[user_id].schedule_minutes,
-                    args=[USER_CONFIGS[user_id], USER_API_CLIENTS[user_id], site, user_id],
-                    id=job_id,
-                    next_run_time=next_run_time,
-                    max_instances=1,
-                    coalesce=True,
-                    misfire_grace_time=600
-                )
-                
-                logger.info(f"{GREEN}Scheduled new website: {site_name} for user {user_id}{RESET}")
+            # Schedule new websites, starting within at most 10 minutes
+            for job in _schedule_site_jobs(user_id, new_websites, max_stagger=600):
+                logger.info("%sScheduled new website: %s for user %s%s", GREEN, job.site_name, user_id, RESET)
                 
             USER_JOBS_CREATED[user_id] = True
             
-            # Update status summary immediately in production mode
+            # Update status summary soon in production mode
             if LOG_MODE == "production":
-                generate_user_status_summary()
+                request_status_summary()
         else:
             if LOG_MODE == "debug":
-                logger.info(f"{BLUE}No new websites found for user {user_id}{RESET}")
+                logger.info("%sNo new websites found for user %s%s", BLUE, user_id, RESET)
                 
     except Exception as e:
-        logger.error(f"{RED}Error refreshing websites for user {user_id}: {str(e)}{RESET}")
+        logger.error("%sError refreshing websites for user %s: %s%s", RED, user_id, e, RESET)
 
 def setup_website_refresh_job(scheduler):
     """Set up a job to periodically check for new websites in all spaces"""
@@ -1103,11 +1802,11 @@ def setup_website_refresh_job(scheduler):
     refresh_interval_minutes = int(os.getenv("WEBSITE_REFRESH_INTERVAL", "60"))
     
     if refresh_interval_minutes > 0:
-        logger.info(f"{GREEN}Setting up periodic website refresh job every {refresh_interval_minutes} minutes{RESET}")
+        logger.info("%sSetting up periodic website refresh job every %s minutes%s", GREEN, refresh_interval_minutes, RESET)
         
         # Function to refresh all users
         def refresh_all_users():
-            logger.info(f"{CYAN}Checking for new websites for all users...{RESET}")
+            logger.info("%sChecking for new websites for all users...%s", CYAN, RESET)
             for user_id in list(USER_CONFIGS.keys()):
                 refresh_websites_for_user(user_id)
         
@@ -1118,20 +1817,44 @@ def setup_website_refresh_job(scheduler):
             id="website_refresh_job",
             replace_existing=True
         )
+        SYSTEM_JOB_IDS.add("website_refresh_job")
     else:
-        logger.info(f"{YELLOW}Website refresh job disabled (interval set to {refresh_interval_minutes}){RESET}")
+        logger.info("%sWebsite refresh job disabled (interval set to %s)%s", YELLOW, refresh_interval_minutes, RESET)
 
 # ------------------- FastAPI Setup -------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run startup before the API serves requests and shutdown after it stops"""
+    # Let more sync endpoints run at once, so startup.py's burst of provisioning calls doesn't queue
+    anyio.to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+    # Startup and shutdown block on the crawler API and the scheduler, so keep them off the event loop
+    await run_in_threadpool(startup_event)
+    yield
+    await run_in_threadpool(shutdown_event)
+
 app = FastAPI(
     title="Crawler Scheduler API",
     description="Multi-user crawler scheduler API for Intric integration",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Initialize scheduler
-scheduler = BackgroundScheduler(executors={'default': ThreadPoolExecutor(10)})
+# Jobs mostly wait on the API, so the pool can be larger than the CPU count
+SCHEDULER_MAX_WORKERS = int(os.getenv("SCHEDULER_MAX_WORKERS") or min(32, (os.cpu_count() or 1) * 5))
+scheduler = BackgroundScheduler(
+    executors={'default': ThreadPoolExecutor(SCHEDULER_MAX_WORKERS)},
+    # Never run the same job twice at once, and fold missed runs into one
+    job_defaults={'misfire_grace_time': 300, 'coalesce': True, 'max_instances': 1}
+)
 scheduler.start()
 
+# Scheduled jobs only trigger crawls; one monitor thread tracks all running crawls
+crawl_monitor = CrawlMonitor()
+crawl_monitor.start()
+threading.Thread(target=_summary_worker, name="status-summary", daemon=True).start()
+
 # Set up status logger
 setup_status_logger(scheduler)
 
@@ -1148,16 +1871,16 @@ def set_config(user_id: str, payload: ConfigModel):
     # Clear existing jobs for this user
     clear_jobs(user_id)
 
-    USER_CONFIGS[user_id] = AppConfig(
+    add_user_config(user_id, AppConfig(
         api_key=payload.api_key,
         base_url=payload.base_url,
         schedule_minutes=payload.schedule_minutes,
-        website_filter={w.strip().lower().rstrip('/') for w in payload.website_filter if w.strip()},
+        website_filter=frozenset(w.strip().lower().rstrip('/') for w in payload.website_filter if w.strip()),
         status_check_interval=payload.status_check_interval,
         space_id=payload.space_id,
         space_name=payload.space_name,
         crawl_all_space_websites=payload.crawl_all_space_websites
-    )
+    ))
     USER_API_CLIENTS[user_id] = CrawlerAPIClient(USER_CONFIGS[user_id])
     USER_WEBSITES[user_id] = []
     USER_JOBS_CREATED[user_id] = False
@@ -1195,51 +1918,16 @@ def start_scheduling(user_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to fetch websites: {str(e)}")
 
     if not USER_WEBSITES[user_id]:
-        logger.warning(f"No websites matched filter for user {user_id}, no jobs to schedule.")
+        logger.warning("No websites matched filter for user %s, no jobs to schedule.", user_id)
         return {
             "detail": "No websites matched filter, nothing scheduled.",
             "user_id": user_id,
             "websites_count": 0
         }
 
-    # Initialize job status tracking
-    if user_id not in USER_JOB_STATUS:
-        USER_JOB_STATUS[user_id] = {}
-
     # Create job for each site with staggered initial runs
-    for i, site in enumerate(USER_WEBSITES[user_id]):
-        site_id = site.get("id")
-        site_name = site.get("name") or site_id
-        if not site_id:
-            continue
-
-        # Initialize job status
-        USER_JOB_STATUS[user_id][site_id] = JobStatus(
-            site_id=site_id,
-            site_name=site_name,
-            status="idle",
-            last_update=datetime.now()
-        )
-            
-        job_id = f"{user_id}_crawl_{site_id}"
-        
-        # Calculate staggered start time
-        stagger_seconds = min(i * 20, 300)
-        next_run_time = datetime.now() + timedelta(seconds=stagger_seconds)
-        
-        logger.info(f"Scheduling site {site_id} every {USER_CONFIGS[user_id].schedule_minutes} min for user {user_id}")
-        
-        scheduler.add_job(
-            run_crawl_for_site,
-            "interval",
-            minutes=USER_CONFIGS[user_id].schedule_minutes,
-            args=[USER_CONFIGS[user_id], USER_API_CLIENTS[user_id], site, user_id],
-            id=job_id,
-            next_run_time=next_run_time,
-            max_instances=1,
-            coalesce=True,
-            misfire_grace_time=600
-        )
+    for job in _schedule_site_jobs(user_id, USER_WEBSITES[user_id]):
+        logger.info("Scheduling site %s every %s min for user %s", job.site_id, USER_CONFIGS[user_id].schedule_minutes, user_id)
 
     USER_JOBS_CREATED[user_id] = True
     
@@ -1280,6 +1968,17 @@ def test_crawling(user_id: str):
         "user_id": user_id
     }
 
+@app.post("/provision/{user_id}")
+def provision_user(user_id: str, payload: ProvisionModel):
+    """Set a user's config, then start scheduling and run a test crawl, without separate round trips"""
+    result = {"user_id": user_id, "config": set_config(user_id, payload)["config"]}
+    if payload.start:
+        result["start"] = start_scheduling(user_id)
+    if payload.test:
+        result["test"] = test_crawling(user_id)
+    result["detail"] = f"User {user_id} provisioned."
+    return result
+
 @app.get("/status/{user_id}")
 def get_status(user_id: str):
     """Get current config and status for a user"""
@@ -1290,8 +1989,7 @@ def get_status(user_id: str):
         )
 
     # Get job IDs
-    job_list = scheduler.get_jobs()
-    job_ids = [job.id for job in job_list if job.id.startswith(f"{user_id}_crawl_")]
+    job_ids = sorted(USER_JOB_IDS.get(user_id, ()))
     
     # Get space name if we only have ID
     space_name = USER_CONFIGS[user_id].space_name
@@ -1304,19 +2002,18 @@ def get_status(user_id: str):
 
     # Convert job statuses to response format
     job_statuses = []
-    if user_id in USER_JOB_STATUS:
-        for site_id, status in USER_JOB_STATUS[user_id].items():
-            job_statuses.append({
-                "site_id": status.site_id,
-                "site_name": status.site_name,
-                "status": status.status,
-                "run_id": status.run_id,
-                "start_time": status.start_time,
-                "end_time": status.end_time,
-                "error_message": status.error_message,
-                "last_update": status.last_update,
-                "last_successful_crawl": status.last_successful_crawl
-            })
+    for status in snapshot_user_jobs(user_id):
+        job_statuses.append({
+            "site_id": status.site_id,
+            "site_name": status.site_name,
+            "status": status.status,
+            "run_id": status.run_id,
+            "start_time": status.start_time,
+            "end_time": status.end_time,
+            "error_message": status.error_message,
+            "last_update": status.last_update,
+            "last_successful_crawl": status.last_successful_crawl
+        })
 
     # Get list of websites
     websites_matched = []
@@ -1334,7 +2031,7 @@ def get_status(user_id: str):
             "schedule_minutes": USER_CONFIGS[user_id].schedule_minutes,
             "status_check_interval": USER_CONFIGS[user_id].status_check_interval,
             "website_filter": list(USER_CONFIGS[user_id].website_filter),
-            "space_id": USER_CONFIGS[user_id].space_id,
+            "space_id": USER_API_CLIENTS[user_id].space_id or USER_CONFIGS[user_id].space_id,
             "space_name": space_name
         },
         "websites_matched": websites_matched,
@@ -1345,49 +2042,64 @@ def get_status(user_id: str):
     }
 
 @app.get("/users")
-def list_users():
+async def list_users():
     """List all configured users"""
     return {
         "users": list(USER_CONFIGS.keys()),
         "total": len(USER_CONFIGS)
     }
 
-@app.get("/system/health")
-def health_check():
+# Last encoded health payload; startup retries and container probes within the TTL reuse it
+HEALTH_CACHE_TTL = 5
+_health_cache: Dict[str, Any] = {"ts": 0.0, "body": None}
+
+@app.get("/system/health", response_class=ORJSONResponse, response_model=None)
+async def health_check():
     """Simple health check endpoint"""
-    job_count = len(scheduler.get_jobs())
-    user_count = len(USER_CONFIGS)
+    now = time.monotonic()
+    if _health_cache["body"] is None or now - _health_cache["ts"] >= HEALTH_CACHE_TTL:
+        job_count = scheduled_job_count()
+        user_count = len(USER_CONFIGS)
+        
+        # Encode once per TTL window; cached hits skip validation and serialization entirely
+        _health_cache["body"] = orjson.dumps({
+            "status": "ok",
+            "users": user_count,
+            "jobs": job_count,
+            "scheduler_running": scheduler.running
+        })
+        _health_cache["ts"] = now
     
-    return {
-        "status": "ok",
-        "users": user_count,
-        "jobs": job_count,
-        "scheduler_running": scheduler.running
-    }
+    return Response(
+        content=_health_cache["body"],
+        media_type="application/json",
+        headers={"Cache-Control": f"max-age={HEALTH_CACHE_TTL}"}
+    )
 
-@app.post("/system/status-summary")
-def generate_status_summary():
+@app.post("/system/status-summary", response_class=ORJSONResponse)
+async def generate_status_summary():
     """Generate a status summary for all users"""
-    generate_user_status_summary.called_from_endpoint = True
-    summary_data = generate_user_status_summary()
+    # Building the summary takes the job locks and writes the log, so keep it off the event loop
+    summary_data = await run_in_threadpool(generate_user_status_summary, called_from_endpoint=True)
     
-    # Return the structured summary in the response
-    return {
+    # Return the structured summary in the response, serialized directly with orjson
+    return ORJSONResponse({
         "detail": "Status summary generated",
         "timestamp": datetime.now().isoformat(),
         "summary": summary_data
-    }
+    })
 
 # ------------------- Application Startup/Shutdown -------------------
-@app.on_event("startup")
 def startup_event():
     """Initialize the application on startup"""
     # Clear any existing state
     USER_CONFIGS.clear()
+    USER_GROUPS.clear()
     USER_API_CLIENTS.clear()
     USER_WEBSITES.clear()
     USER_JOBS_CREATED.clear()
     USER_JOB_STATUS.clear()
+    USER_JOB_IDS.clear()
     
     # Load from users.json
     load_users_from_json()
@@ -1398,18 +2110,21 @@ def startup_event():
     # Set up the website refresh job
     setup_website_refresh_job(scheduler)
     
-    logger.info(f"{GREEN}Crawler API started. Scheduler running: {scheduler.running}{RESET}")
+    logger.info("%sCrawler API started. Scheduler running: %s%s", GREEN, scheduler.running, RESET)
     
     # Generate initial status summary in production mode
     if LOG_MODE == "production":
         generate_user_status_summary()
 
-@app.on_event("shutdown")
 def shutdown_event():
+    """Stop the scheduler and background threads"""
     logger.info("Shutting down APScheduler...")
     scheduler.shutdown()
+    crawl_monitor.stop()
+    stop_summary_worker()
 
 # For running directly with Python
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # "auto" picks uvloop and httptools when installed (see requirements.txt), asyncio/h11 otherwise
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto")
\ No newline at end of file
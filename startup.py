@@ -5,11 +5,17 @@ This script reads users.json and configures all users automatically.
 """
 import os
 import sys
-import json
-import time
+import signal
+import threading
 import logging
+import ijson
+import orjson
 import requests
 import argparse
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(
@@ -18,178 +24,195 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def configure_user(api_url, user_config):
-    """Configure a single user with potentially multiple spaces"""
+# Users configured at the same time
+CONFIGURE_WORKERS = 8
+# users.json files larger than this are parsed incrementally
+STREAM_CONFIG_BYTES = 1024 * 1024
+# Per-space config fields sent to /provision, with their defaults
+SPACE_FIELDS = (
+    ("schedule_minutes", 5),
+    ("website_filter", []),
+    ("status_check_interval", 60),
+    ("space_id", None),
+    ("space_name", None),
+    ("crawl_all_space_websites", False),
+)
+JSON_HEADERS = {"Content-Type": "application/json"}
+# (connect, read) timeouts. Connecting to the local API is instant, so a refused or hung
+# connect fails fast and is retried; /provision reads stay long because the API fetches
+# the space's websites from Intric before answering
+HEALTH_TIMEOUT = (1.0, 2.0)
+PROVISION_TIMEOUT = (1.0, 60.0)
+# Retries of API calls (urllib3 backs off exponentially, starting from RETRY_BACKOFF seconds)
+MIN_RETRIES = 3
+RETRY_BACKOFF = 0.1
+
+def iter_users(config_file):
+    """Yield user configs from users.json, or from a .jsonl file with one user per line"""
+    path = pathlib.Path(config_file)
+    if path.suffix == '.jsonl':
+        with path.open('rb') as f:
+            for line in f:
+                if line.strip():
+                    yield orjson.loads(line)
+    elif path.stat().st_size > STREAM_CONFIG_BYTES:
+        with path.open('rb') as f:
+            yield from ijson.items(f, 'users.item', use_float=True)
+    else:
+        # Small files: one read of the raw bytes, parsed by orjson without decoding to str first
+        yield from orjson.loads(path.read_bytes()).get('users', [])
+
+def probe_retries(wait):
+    """Number of retries whose exponential backoff (0.1s, 0.2s, 0.4s, ...) covers at least `wait` seconds"""
+    retries, waited = 0, 0.0
+    while waited < wait:
+        waited += RETRY_BACKOFF * 2 ** retries
+        retries += 1
+    return max(retries, MIN_RETRIES)
+
+def create_session(retries=MIN_RETRIES):
+    """Create a session that keeps connections to the API open between calls and retries failed connects"""
+    session = requests.Session()
+    session.headers["Connection"] = "keep-alive"
+    retry = Retry(total=retries, backoff_factor=RETRY_BACKOFF, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def build_payload(base, space_config):
+    """Encode the /provision body for one space (or single-space user) with orjson"""
+    return orjson.dumps({**base, **{key: space_config.get(key, default) for key, default in SPACE_FIELDS}})
+
+def provision(session, api_url, user_id, body):
+    """Send a pre-encoded config to /provision and return the decoded response"""
+    resp = session.post(f"{api_url}/provision/{user_id}", data=body, headers=JSON_HEADERS, timeout=PROVISION_TIMEOUT)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+def user_spaces(user_config):
+    """Yield (id to configure, space label, /provision body) for each space of a users.json entry"""
     user_id = user_config['user_id']
-    api_key = user_config['api_key']
-    base_url = user_config['base_url']
+    # Fields shared by every space of this user
+    base = {"api_key": user_config['api_key'], "base_url": user_config['base_url']}
     
     # Check if we're using the old format (single space) or new format (multiple spaces)
     if 'spaces' in user_config:
         # New format with multiple spaces
         spaces = user_config['spaces']
-        logger.info(f"Configuring user {user_id} with {len(spaces)} spaces")
+        logger.info("Configuring user %s with %s spaces", user_id, len(spaces))
         
-        success_count = 0
         for i, space_config in enumerate(spaces):
             # Create a unique sub-user ID for each space
             space_user_id = f"{user_id}_space{i+1}" if len(spaces) > 1 else user_id
-            
-            # Create payload for this space configuration
-            payload = {
-                "api_key": api_key,
-                "base_url": base_url,
-                "schedule_minutes": space_config.get("schedule_minutes", 5),
-                "website_filter": space_config.get("website_filter", []),
-                "status_check_interval": space_config.get("status_check_interval", 60),
-                "space_id": space_config.get("space_id"),
-                "space_name": space_config.get("space_name"),
-                "crawl_all_space_websites": space_config.get("crawl_all_space_websites", False)
-            }
-            
-            try:
-                logger.info(f"Configuring {space_user_id} with space {space_config.get('space_name') or space_config.get('space_id')}")
-                
-                # Set the configuration for this space
-                resp = requests.post(f"{api_url}/config/{space_user_id}", json=payload, timeout=30)
-                resp.raise_for_status()
-                
-                # Start the crawler for this space
-                resp = requests.post(f"{api_url}/start/{space_user_id}", timeout=30)
-                resp.raise_for_status()
-                result = resp.json()
-                logger.info(f"Started {space_user_id}: {result['detail']}")
-                
-                # Then run a test crawl to ensure it starts immediately
-                logger.info(f"Triggering immediate initial crawl for {space_user_id}")
-                test_resp = requests.post(f"{api_url}/test/{space_user_id}", timeout=15)
-                if test_resp.ok:
-                    logger.info(f"Initial crawl triggered for {space_user_id}")
-                
-                success_count += 1
-                
-                # Add a slight delay between spaces to prevent overloading
-                if i < len(spaces) - 1:
-                    time.sleep(2)
-                    
-            except Exception as e:
-                logger.error(f"Error setting up {space_user_id}: {str(e)}")
-        
-        return success_count > 0
+            yield space_user_id, space_config.get('space_name') or space_config.get('space_id'), build_payload(base, space_config)
     else:
-        # Old format with single space - use existing code
-        payload = {
-            "api_key": api_key,
-            "base_url": base_url,
-            "schedule_minutes": user_config.get("schedule_minutes", 5),
-            "website_filter": user_config.get("website_filter", []),
-            "status_check_interval": user_config.get("status_check_interval", 60),
-            "space_id": user_config.get("space_id"),
-            "space_name": user_config.get("space_name"),
-            "crawl_all_space_websites": user_config.get("crawl_all_space_websites", False)
-        }
-        
-        try:
-            logger.info(f"Configuring user {user_id}")
-            # Set the user configuration
-            resp = requests.post(f"{api_url}/config/{user_id}", json=payload, timeout=30)
-            resp.raise_for_status()
-            logger.info(f"Configuration set for user {user_id}")
-            
-            # Start the crawler for this user
-            resp = requests.post(f"{api_url}/start/{user_id}", timeout=30)
-            resp.raise_for_status()
-            result = resp.json()
-            logger.info(f"Started user {user_id}: {result['detail']}")
-            
-            # Then run a test crawl to ensure it starts immediately
-            logger.info(f"Triggering immediate initial crawl for {user_id}")
-            test_resp = requests.post(f"{api_url}/test/{user_id}", timeout=15)
-            if test_resp.ok:
-                logger.info(f"Initial crawl triggered for {user_id}")
-            
-            return True
-        except Exception as e:
-            logger.error(f"Error setting up user {user_id}: {str(e)}")
-            return False
+        # Old format with single space
+        yield user_id, None, build_payload(base, user_config)
 
-def main():
-    parser = argparse.ArgumentParser(description="Start crawler for multiple users from JSON config")
-    parser.add_argument("--api", default="http://127.0.0.1:8000", help="API URL (default: http://127.0.0.1:8000)")
-    parser.add_argument("--config", default="/app/users.json", help="Path to users.json config file")
-    parser.add_argument("--wait", type=int, default=5, help="Seconds to wait for API server to start")
-    args = parser.parse_args()
-    
-    api_url = args.api
-    config_file = args.config
-    
-    # Wait for the API to be available
-    logger.info(f"Waiting {args.wait} seconds for API server to start...")
-    time.sleep(args.wait)
-    
-    # Check if API is available
-    max_retries = 5
-    retry_delay = 3
-    
-    for i in range(max_retries):
-        try:
-            resp = requests.get(f"{api_url}/system/health", timeout=5)
-            if resp.ok:
-                logger.info("API server is up and running!")
-                break
-            logger.warning(f"API server not ready (attempt {i+1}/{max_retries})")
-        except Exception as e:
-            logger.warning(f"API server not ready: {str(e)} (attempt {i+1}/{max_retries})")
+def provision_space(api_url, session, space_user_id, label, body):
+    """Configure, start and initially crawl one space; returns whether it succeeded"""
+    try:
+        if label:
+            logger.info("Configuring %s with space %s", space_user_id, label)
+        else:
+            logger.info("Configuring user %s", space_user_id)
         
-        if i < max_retries - 1:
-            logger.info(f"Retrying in {retry_delay} seconds...")
-            time.sleep(retry_delay)
-    else:
-        logger.error(f"API server at {api_url} is not responding after {max_retries} attempts")
+        # Set the configuration, start the crawler and trigger an initial crawl in one call
+        result = provision(session, api_url, space_user_id, body)
+        logger.info("Started %s: %s", space_user_id, result['start']['detail'])
+        logger.info("Initial crawl triggered for %s", space_user_id)
+        return True
+    except Exception as e:
+        logger.error("Error setting up %s: %s", space_user_id, e)
+        return False
+
+def run(api_url, config_file, session):
+    """Wait for the API, then configure and start every user in the config file"""
+    # Probe the API right away; the session's retries back off until it is up (see probe_retries)
+    try:
+        resp = session.get(f"{api_url}/system/health", timeout=HEALTH_TIMEOUT)
+        resp.raise_for_status()
+        logger.info("API server is up and running!")
+    except requests.RequestException as e:
+        logger.error("API server at %s is not responding: %s", api_url, e)
         logger.error("Exiting...")
         return 1
     
     # Load user configurations
     try:
-        logger.info(f"Loading user configurations from {config_file}")
-        with open(config_file, 'r') as f:
-            config_data = json.load(f)
-        
-        users = config_data.get('users', [])
-        if not users:
+        logger.info("Loading user configurations from %s", config_file)
+        # Provision every space of every user in parallel as they are read (at most
+        # CONFIGURE_WORKERS at once); the API paces the crawl triggers itself
+        results = {}
+        results_lock = threading.Lock()
+        # Read ahead at most this many spaces, so a streamed file isn't queued up in memory whole
+        in_flight = threading.BoundedSemaphore(CONFIGURE_WORKERS * 2)
+
+        def tally(user_id, future):
+            try:
+                # A user counts as started when at least one of its spaces was
+                if future.result():
+                    with results_lock:
+                        results[user_id] = True
+            finally:
+                in_flight.release()
+
+        with ThreadPoolExecutor(max_workers=CONFIGURE_WORKERS) as executor:
+            for user_config in iter_users(config_file):
+                user_id = user_config['user_id']
+                with results_lock:
+                    results.setdefault(user_id, False)
+                for space in user_spaces(user_config):
+                    in_flight.acquire()
+                    future = executor.submit(provision_space, api_url, session, *space)
+                    future.add_done_callback(lambda f, user_id=user_id: tally(user_id, f))
+        if not results:
             logger.error("No users found in configuration file")
             return 1
+        success_count = sum(results.values())
         
-        logger.info(f"Found {len(users)} users in configuration")
-        
-        # Configure all users
-        success_count = 0
-        for user_config in users:
-            if configure_user(api_url, user_config):
-                success_count += 1
-        
-        logger.info(f"Successfully configured and started {success_count}/{len(users)} users")
+        logger.info("Successfully configured and started %s/%s users", success_count, len(results))
         
         # Keep the script running to observe logs
         logger.info("All users configured. Crawler is running in the background.")
         logger.info("Press Ctrl+C to exit (container will continue running)")
         
-        # Wait indefinitely (container will be kept alive by the FastAPI process)
-        while True:
-            time.sleep(3600)  # Sleep for an hour - this is just to keep the script alive
+        # Wait indefinitely (container will be kept alive by the FastAPI process),
+        # sleeping in the kernel until a signal arrives instead of waking up periodically
+        if hasattr(signal, "pause"):
+            while True:
+                signal.pause()
+        else:
+            threading.Event().wait()
             
     except KeyboardInterrupt:
         logger.info("Startup script exiting. Crawler will continue running.")
         return 0
     except FileNotFoundError:
-        logger.error(f"Configuration file not found: {config_file}")
+        logger.error("Configuration file not found: %s", config_file)
         return 1
-    except json.JSONDecodeError:
-        logger.error(f"Invalid JSON in configuration file: {config_file}")
+    except (orjson.JSONDecodeError, ijson.JSONError):
+        logger.error("Invalid JSON in configuration file: %s", config_file)
         return 1
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         return 1
 
+def main():
+    parser = argparse.ArgumentParser(description="Start crawler for multiple users from JSON config")
+    parser.add_argument("--api", default="http://127.0.0.1:8000", help="API URL (default: http://127.0.0.1:8000)")
+    parser.add_argument("--config", default="/app/users.json", help="Path to users.json config file")
+    parser.add_argument("--wait", type=int, default=20, help="Seconds to keep probing for the API server before giving up")
+    args = parser.parse_args()
+    
+    api_url = args.api
+    config_file = args.config
+    session = create_session(probe_retries(args.wait))
+    try:
+        return run(api_url, config_file, session)
+    finally:
+        session.close()
+
 if __name__ == "__main__":
     sys.exit(main())
\ No newline at end of file